@@ -4,6 +4,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from apps.finance.models import FinanceRecord
 from apps.operations.models import CheckinTask, CheckoutTask, CleaningTask
 from apps.operations.services import sync_cleaning_tasks_for_booking
 from apps.properties.models import Property
@@ -101,6 +102,40 @@ class CalendarEventSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class TaskMiniSerializer(serializers.ModelSerializer):
+    """
+    Краткое представление задачи в карточке брони.
+
+    Поля общие для всех моделей задач, поэтому сериализатор на CleaningTask
+    подходит и для CheckinTask / CheckoutTask.
+    """
+
+    class Meta:
+        model = CleaningTask
+        fields = [
+            "id",
+            "task_type",
+            "title",
+            "status",
+            "priority",
+            "executor",
+            "deadline",
+        ]
+
+
+class FinanceMiniSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FinanceRecord
+        fields = [
+            "id",
+            "record_type",
+            "category",
+            "amount",
+            "currency",
+            "operation_date",
+        ]
+
+
 class GuestViewSet(viewsets.ModelViewSet):
     queryset = Guest.objects.all().order_by("full_name")
     serializer_class = GuestSerializer
@@ -262,44 +297,19 @@ class BookingViewSet(viewsets.ModelViewSet):
         guest_data = GuestSerializer(booking.guest).data
 
         # Задачи.
-        checkin_tasks = CheckinTask.objects.filter(booking=booking)
-        checkout_tasks = CheckoutTask.objects.filter(booking=booking)
-        cleaning_tasks = CleaningTask.objects.filter(booking=booking)
-
-        class TaskMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = CleaningTask
-                fields = [
-                    "id",
-                    "task_type",
-                    "title",
-                    "status",
-                    "priority",
-                    "executor",
-                    "deadline",
-                ]
+        task_fields = TaskMiniSerializer.Meta.fields
+        checkin_tasks = CheckinTask.objects.filter(booking=booking).only(*task_fields)
+        checkout_tasks = CheckoutTask.objects.filter(booking=booking).only(*task_fields)
+        cleaning_tasks = CleaningTask.objects.filter(booking=booking).only(*task_fields)
 
         checkin_data = TaskMiniSerializer(checkin_tasks, many=True).data
         checkout_data = TaskMiniSerializer(checkout_tasks, many=True).data
         cleaning_data = TaskMiniSerializer(cleaning_tasks, many=True).data
 
         # Финансовые записи по брони.
-        from apps.finance.models import FinanceRecord  # локальный импорт, чтобы избежать циклов
-
-        fin_qs = FinanceRecord.objects.filter(booking=booking)
-
-        class FinanceMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = FinanceRecord
-                fields = [
-                    "id",
-                    "record_type",
-                    "category",
-                    "amount",
-                    "currency",
-                    "operation_date",
-                ]
-
+        fin_qs = FinanceRecord.objects.filter(booking=booking).only(
+            *FinanceMiniSerializer.Meta.fields
+        )
         finance_data = FinanceMiniSerializer(fin_qs, many=True).data
 
         # История статусов.
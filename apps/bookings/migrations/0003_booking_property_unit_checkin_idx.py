@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_bookingstatuslog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['property', 'check_in', 'check_out'], name='booking_prop_ci_co_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['unit', 'check_in'], name='booking_unit_ci_idx'),
+        ),
+    ]
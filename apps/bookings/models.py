@@ -157,6 +157,15 @@ class Booking(models.Model):
         verbose_name = "Бронирование"
         verbose_name_plural = "Бронирования"
         ordering = ["-check_in", "-id"]
+        indexes = [
+            # Пересечение брони с периодом по объекту (карточка, загрузка отеля).
+            models.Index(
+                fields=["property", "check_in", "check_out"],
+                name="booking_prop_ci_co_idx",
+            ),
+            # Брони юнита по дате заезда (карточка юнита, календарь).
+            models.Index(fields=["unit", "check_in"], name="booking_unit_ci_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Бронь #{self.id} — {self.guest.full_name}"
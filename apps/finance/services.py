@@ -2,6 +2,7 @@ import calendar
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 from django.db import transaction
@@ -14,6 +15,7 @@ from apps.properties.models import Property
 from .models import Expense, FinanceRecord, OwnerReport, Payout
 
 
+@lru_cache(maxsize=512)
 def get_period_bounds(year: int, month: int) -> Tuple[date, date]:
     first_day = date(year, month, 1)
     last_day = calendar.monthrange(year, month)[1]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('operations', '0004_maintenancetask_ai_last_analyzed_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cleaningtask',
+            index=models.Index(fields=['unit', 'status', '-created_at'], name='cleaningtask_unit_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancetask',
+            index=models.Index(fields=['unit', 'status', '-created_at'], name='maintenancetask_unit_st_idx'),
+        ),
+    ]
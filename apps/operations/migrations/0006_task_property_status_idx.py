@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('operations', '0005_cleaningtask_maintenancetask_unit_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='checkintask',
+            index=models.Index(fields=['property', 'status'], name='checkin_prop_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkouttask',
+            index=models.Index(fields=['property', 'status'], name='checkout_prop_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cleaningtask',
+            index=models.Index(fields=['property', 'status'], name='cleaning_prop_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancetask',
+            index=models.Index(fields=['property', 'status'], name='maintenance_prop_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerrequesttask',
+            index=models.Index(fields=['property', 'status'], name='ownerrequest_prop_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qualityinspectiontask',
+            index=models.Index(fields=['property', 'status'], name='quality_prop_status_idx'),
+        ),
+    ]
@@ -136,6 +136,15 @@ class CleaningTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача уборки"
         verbose_name_plural = "Задачи уборки"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="cleaning_prop_status_idx"),
+            # Карточка юнита: последние задачи юнита по статусу.
+            models.Index(
+                fields=["unit", "status", "-created_at"],
+                name="cleaningtask_unit_status_idx",
+            ),
+        ]
 
 
 class MaintenanceTask(TaskBaseModel):
@@ -195,6 +204,15 @@ class MaintenanceTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача по эксплуатации"
         verbose_name_plural = "Задачи по эксплуатации"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="maintenance_prop_status_idx"),
+            # Карточка юнита: последние задачи юнита по статусу.
+            models.Index(
+                fields=["unit", "status", "-created_at"],
+                name="maintenancetask_unit_st_idx",
+            ),
+        ]
 
 
 class CheckinTask(TaskBaseModel):
@@ -215,6 +233,10 @@ class CheckinTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача заселения"
         verbose_name_plural = "Задачи заселения"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="checkin_prop_status_idx"),
+        ]
 
 
 class CheckoutTask(TaskBaseModel):
@@ -235,6 +257,10 @@ class CheckoutTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача выселения"
         verbose_name_plural = "Задачи выселения"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="checkout_prop_status_idx"),
+        ]
 
 
 class QualityInspectionTask(TaskBaseModel):
@@ -264,6 +290,10 @@ class QualityInspectionTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача контроля качества"
         verbose_name_plural = "Задачи контроля качества"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="quality_prop_status_idx"),
+        ]
 
 
 class OwnerRequestTask(TaskBaseModel):
@@ -280,6 +310,10 @@ class OwnerRequestTask(TaskBaseModel):
     class Meta:
         verbose_name = "Задача по запросу собственника"
         verbose_name_plural = "Задачи по запросам собственников"
+        indexes = [
+            # Активные задачи по объекту (карточка объекта, панели GM / PM).
+            models.Index(fields=["property", "status"], name="ownerrequest_prop_status_idx"),
+        ]
 
 
 class TaskPhoto(models.Model):
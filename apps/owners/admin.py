@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Owner
+from .models import Owner, OwnerMonthlyRollup
 
 
 @admin.register(Owner)
@@ -9,3 +9,10 @@ class OwnerAdmin(admin.ModelAdmin):
     list_filter = ("status", "is_active")
     search_fields = ("name", "phone", "email", "tax_id")
 
+
+@admin.register(OwnerMonthlyRollup)
+class OwnerMonthlyRollupAdmin(admin.ModelAdmin):
+    list_display = ("owner", "year", "month", "income_total", "expense_total", "net_total", "computed_at")
+    list_filter = ("year", "month")
+    search_fields = ("owner__name",)
+    readonly_fields = ("computed_at",)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class OwnersConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.owners"
+    verbose_name = "Собственники"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.owners.models import Owner
+from apps.owners.services import rebuild_owner_rollup
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает сводки OwnerMonthlyRollup для дашборда собственника"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", type=int, help="ID собственника (по умолчанию — все активные)")
+        parser.add_argument("--year", type=int, help="Год (по умолчанию — текущий)")
+        parser.add_argument("--month", type=int, help="Месяц 1–12 (по умолчанию — текущий)")
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        year = options["year"] or today.year
+        month = options["month"] or today.month
+        if not 1 <= month <= 12:
+            raise CommandError("Месяц должен быть в диапазоне 1–12.")
+
+        owners = Owner.objects.filter(is_active=True)
+        if options["owner"]:
+            owners = Owner.objects.filter(pk=options["owner"])
+            if not owners.exists():
+                raise CommandError(f"Собственник #{options['owner']} не найден.")
+
+        count = 0
+        for owner in owners:
+            rebuild_owner_rollup(owner, year, month)
+            count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Сводки пересчитаны: {count} за {month:02d}.{year}")
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-15 22:58
+
+import django.core.serializers.json
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('owners', '0002_owner_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OwnerMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField(verbose_name='Год')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='Месяц')),
+                ('income_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='Сумма доходов')),
+                ('expense_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='Сумма расходов')),
+                ('net_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='Чистая прибыль')),
+                ('properties_data', models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Финансы и занятость по объектам (в формате ответа дашборда).', verbose_name='Данные по объектам')),
+                ('big_tasks', models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Крупные задачи')),
+                ('computed_at', models.DateTimeField(auto_now=True, verbose_name='Рассчитано')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='owners.owner', verbose_name='Собственник')),
+            ],
+            options={
+                'verbose_name': 'Сводка собственника за месяц',
+                'verbose_name_plural': 'Сводки собственников за месяц',
+                'ordering': ['-year', '-month', 'owner'],
+                'unique_together': {('owner', 'year', 'month')},
+            },
+        ),
+    ]
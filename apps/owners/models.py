@@ -1,4 +1,7 @@
+from decimal import Decimal
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 
@@ -44,3 +47,64 @@ class Owner(models.Model):
 
     def __str__(self) -> str:
         return self.name
+
+
+class OwnerMonthlyRollup(models.Model):
+    """
+    Предрасчитанная сводка дашборда собственника за месяц.
+
+    Заполняется командой rebuild_owner_rollup (ночной cron) либо при первом
+    обращении к дашборду; сбрасывается сигналами при изменении бронирований,
+    финансовых записей, расходов и задач по объектам собственника.
+    """
+
+    owner = models.ForeignKey(
+        Owner,
+        on_delete=models.CASCADE,
+        related_name="monthly_rollups",
+        verbose_name="Собственник",
+    )
+    year = models.PositiveIntegerField("Год")
+    month = models.PositiveSmallIntegerField("Месяц")
+
+    income_total = models.DecimalField(
+        "Сумма доходов",
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    expense_total = models.DecimalField(
+        "Сумма расходов",
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    net_total = models.DecimalField(
+        "Чистая прибыль",
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    properties_data = models.JSONField(
+        "Данные по объектам",
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        help_text="Финансы и занятость по объектам (в формате ответа дашборда).",
+    )
+    big_tasks = models.JSONField(
+        "Крупные задачи",
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+    )
+    computed_at = models.DateTimeField("Рассчитано", auto_now=True)
+
+    class Meta:
+        verbose_name = "Сводка собственника за месяц"
+        verbose_name_plural = "Сводки собственников за месяц"
+        unique_together = ("owner", "year", "month")
+        ordering = ["-year", "-month", "owner"]
+
+    def __str__(self) -> str:
+        return f"Сводка {self.owner} за {self.month:02d}.{self.year}"
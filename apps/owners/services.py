@@ -0,0 +1,282 @@
+from datetime import timedelta
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.finance.services import generate_owner_report, get_period_bounds
+from apps.properties.services import calculate_hotel_stats_bulk, with_rooms_total
+from apps.properties.models import Property, Unit
+from .models import Owner, OwnerMonthlyRollup
+
+
+# Поля объекта в ответе дашборда.
+_PROPERTY_KEYS = ("id", "name", "type", "city", "district", "address", "status")
+_property_values = attrgetter(*_PROPERTY_KEYS)
+
+_ONE_DAY = timedelta(days=1)
+
+# Сводки незакрытых месяцев не старше этого: страховка от изменений в обход
+# сигналов (QuerySet.update, bulk_create). Закрытые месяцы живут до сброса.
+OWNER_ROLLUP_MAX_AGE = timedelta(minutes=15)
+
+_EMPTY_FINANCE = {
+    "income_total": 0.0,
+    "expense_total": 0.0,
+    "net_total": 0.0,
+}
+
+
+def _to_float(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _calculate_non_hotel_occupancy(prop: Property, year: int, month: int) -> Dict[str, Any]:
+    """
+    Расчёт средней занятости для объектов, отличных от hotel.
+
+    Формула:
+      occupancy_avg = occupied_nights / (units_count * days_in_period)
+    где:
+      - occupied_nights — суммарное количество занятых ночей по всем бронированиям,
+      - units_count — количество активных юнитов объекта,
+      - days_in_period — количество дней в выбранном месяце.
+    """
+    period_start, period_end = get_period_bounds(year, month)
+    days_in_period = (period_end - period_start).days + 1
+
+    units_count = prop.units.filter(
+        status=Unit.Status.ACTIVE,
+        is_active=True,
+    ).count()
+
+    if units_count == 0 or days_in_period <= 0:
+        return {
+            "type": prop.type,
+            "occupancy_avg": None,
+        }
+
+    # Нужны только даты брони — читаем кортежи, без создания объектов Booking.
+    booking_dates = Booking.objects.filter(
+        property=prop,
+        check_in__lt=period_end,
+        check_out__gt=period_start,
+    ).values_list("check_in", "check_out")
+
+    period_stop = period_end + _ONE_DAY
+    occupied_nights = 0
+    for check_in, check_out in booking_dates:
+        start = max(check_in, period_start)
+        end = min(check_out, period_stop)
+        nights = (end - start).days
+        if nights > 0:
+            occupied_nights += nights
+
+    denominator = units_count * days_in_period
+    if denominator <= 0:
+        occupancy_avg = None
+    else:
+        occupancy_avg = occupied_nights / denominator
+
+    return {
+        "type": prop.type,
+        "occupancy_avg": float(occupancy_avg) if occupancy_avg is not None else None,
+    }
+
+
+def _hotel_stats_payload(prop: Property, hotel_stats: Dict[str, Any]) -> Dict[str, Any]:
+    summary = hotel_stats.get("summary", {})
+    return {
+        "type": prop.type,
+        "occupancy_avg": summary.get("occupancy_avg"),
+        "adr_avg": summary.get("adr_avg"),
+        "revpar_avg": summary.get("revpar_avg"),
+    }
+
+
+def _collect_property_stats(
+    properties: List[Property], year: int, month: int
+) -> List[Dict[str, Any]]:
+    """
+    Показатели занятости по всем объектам собственника (для hotel — ещё ADR/RevPAR).
+
+    Метрики всех отелей считаются разом (calculate_hotel_stats_bulk), остальные
+    объекты — по очереди на соединении запроса.
+    """
+    hotels = [prop for prop in properties if prop.type == Property.PropertyType.HOTEL]
+    hotel_stats = calculate_hotel_stats_bulk(hotels, year, month)
+    return [
+        _hotel_stats_payload(prop, hotel_stats[prop.id])
+        if prop.id in hotel_stats
+        else _calculate_non_hotel_occupancy(prop, year, month)
+        for prop in properties
+    ]
+
+
+def build_owner_dashboard(owner: Owner, year: int, month: int) -> Dict[str, Any]:
+    """
+    Живой расчёт данных дашборда собственника за месяц:
+    summary, разрез по объектам и крупные задачи по эксплуатации.
+    """
+    report_data = generate_owner_report(owner, year, month)
+
+    # Карта финансов по объектам: property_id -> finance dict.
+    per_property_finance: Dict[int, Dict[str, float]] = {}
+    for item in report_data.per_property:
+        prop_id = int(item["property_id"])
+        per_property_finance[prop_id] = {
+            "income_total": _to_float(item["income_total"]),
+            "expense_total": _to_float(item["expense_total"]),
+            "net_total": _to_float(item["net_total"]),
+        }
+
+    properties = list(
+        with_rooms_total(
+            Property.objects.filter(owner=owner).select_related("owner", "manager")
+        )
+    )
+    stats_list = _collect_property_stats(properties, year, month)
+
+    properties_data: List[Dict[str, Any]] = [
+        {
+            "property": dict(zip(_PROPERTY_KEYS, _property_values(prop))),
+            "finance": per_property_finance.get(prop.id) or dict(_EMPTY_FINANCE),
+            "stats": stats_payload,
+        }
+        for prop, stats_payload in zip(properties, stats_list)
+    ]
+
+    # Крупные задачи по эксплуатации за период.
+    big_tasks: List[Dict[str, Any]] = []
+    for task in report_data.big_tasks:
+        expenses: List[Dict[str, Any]] = []
+        for e in task.get("expenses", []):
+            expenses.append(
+                {
+                    "id": e["id"],
+                    "category": e["category"],
+                    "amount": _to_float(e["amount"]),
+                    "currency": e["currency"],
+                    "expense_date": e["expense_date"],
+                    "contractor": e["contractor"],
+                    "comment": e["comment"],
+                }
+            )
+
+        big_tasks.append(
+            {
+                "id": task["id"],
+                "title": task["title"],
+                "property_id": task["property_id"],
+                "property_name": task["property_name"],
+                "unit_id": task["unit_id"],
+                "priority": task["priority"],
+                "issue_type": task["issue_type"],
+                "urgency": task["urgency"],
+                "can_check_in": task["can_check_in"],
+                "created_at": task["created_at"],
+                "closed_at": task["closed_at"],
+                "executor_id": task["executor_id"],
+                "expenses": expenses,
+            }
+        )
+
+    return {
+        "income_total": report_data.summary["income_total"],
+        "expense_total": report_data.summary["expense_total"],
+        "net_total": report_data.summary["net_total"],
+        "properties": properties_data,
+        "big_tasks": big_tasks,
+    }
+
+
+def rebuild_owner_rollup(owner: Owner, year: int, month: int) -> OwnerMonthlyRollup:
+    """
+    Пересчитывает и сохраняет OwnerMonthlyRollup за указанный месяц.
+    """
+    data = build_owner_dashboard(owner, year, month)
+    rollup, _created = OwnerMonthlyRollup.objects.update_or_create(
+        owner=owner,
+        year=year,
+        month=month,
+        defaults={
+            "income_total": data["income_total"],
+            "expense_total": data["expense_total"],
+            "net_total": data["net_total"],
+            "properties_data": data["properties"],
+            "big_tasks": data["big_tasks"],
+        },
+    )
+    return rollup
+
+
+def _is_stale_rollup(rollup: OwnerMonthlyRollup) -> bool:
+    # Незакрытый (текущий или будущий) месяц старше OWNER_ROLLUP_MAX_AGE.
+    period_end = get_period_bounds(rollup.year, rollup.month)[1]
+    if period_end < timezone.localdate():
+        return False
+    return rollup.computed_at < timezone.now() - OWNER_ROLLUP_MAX_AGE
+
+
+def get_owner_rollup(owner: Owner, year: int, month: int) -> OwnerMonthlyRollup:
+    """
+    Возвращает сводку собственника за месяц.
+    Живой расчёт выполняется при отсутствии предрасчитанной строки, а для
+    незакрытого месяца — ещё и когда сводка старше OWNER_ROLLUP_MAX_AGE.
+    """
+    rollup: Optional[OwnerMonthlyRollup] = OwnerMonthlyRollup.objects.filter(
+        owner=owner,
+        year=year,
+        month=month,
+    ).first()
+    if rollup is None or _is_stale_rollup(rollup):
+        rollup = rebuild_owner_rollup(owner, year, month)
+    return rollup
+
+
+def iter_months(start, end) -> List[Tuple[int, int]]:
+    """
+    Список (year, month) для всех месяцев, затронутых диапазоном дат [start, end].
+    """
+    if end < start:
+        start, end = end, start
+    months: List[Tuple[int, int]] = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        if month == 12:
+            year, month = year + 1, 1
+        else:
+            month += 1
+    return months
+
+
+def invalidate_owner_rollup(
+    owner_id: Optional[int],
+    months: Optional[Iterable[Tuple[int, int]]] = None,
+) -> None:
+    """
+    Сбрасывает сводки собственника: за указанные месяцы или целиком (months=None).
+
+    Сигналы (см. signals.py) вызывают её при save()/delete() записей. Массовые
+    изменения — QuerySet.update(), bulk_create(), bulk_update() — сигналов не
+    шлют: код, который так меняет Booking, FinanceRecord, Expense,
+    MaintenanceTask, Unit или Property, обязан вызвать invalidate_owner_rollup
+    сам. Незакрытые месяцы дополнительно пересчитываются по OWNER_ROLLUP_MAX_AGE.
+    """
+    if not owner_id:
+        return
+
+    qs = OwnerMonthlyRollup.objects.filter(owner_id=owner_id)
+    if months is None:
+        qs.delete()
+        return
+
+    months_q = Q()
+    for year, month in set(months):
+        months_q |= Q(year=year, month=month)
+    if months_q:
+        qs.filter(months_q).delete()
@@ -0,0 +1,116 @@
+"""
+Сброс OwnerMonthlyRollup при изменении данных, влияющих на дашборд собственника.
+
+Сбрасываются сводки и по новым значениям записи, и по прежним (до сохранения):
+перенос брони на другой месяц или объекта к другому собственнику должен
+сбросить и старый месяц / старого собственника.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.finance.models import Expense, FinanceRecord
+from apps.operations.models import MaintenanceTask
+from apps.properties.models import Property, Unit
+from .services import invalidate_owner_rollup, iter_months
+
+
+# (owner_id, месяцы) — месяцы None означают все месяцы собственника.
+RollupTarget = Tuple[Optional[int], Optional[List[Tuple[int, int]]]]
+
+
+def _property_owner_id(property_id):
+    if not property_id:
+        return None
+    return Property.objects.filter(pk=property_id).values_list("owner_id", flat=True).first()
+
+
+def _booking_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    return [
+        (
+            _property_owner_id(values["property_id"]),
+            iter_months(values["check_in"], values["check_out"]),
+        )
+    ]
+
+
+def _finance_record_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    operation_date = values["operation_date"]
+    months = [(operation_date.year, operation_date.month)]
+    return [
+        (values["owner_id"], months),
+        (_property_owner_id(values["property_id"]), months),
+    ]
+
+
+def _expense_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    property_id = values["property_id"]
+    if property_id is None and values["unit_id"]:
+        property_id = (
+            Unit.objects.filter(pk=values["unit_id"]).values_list("property_id", flat=True).first()
+        )
+    expense_date = values["expense_date"]
+    return [(_property_owner_id(property_id), [(expense_date.year, expense_date.month)])]
+
+
+def _maintenance_task_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    if values["created_at"] is None:
+        return []
+    created = timezone.localtime(values["created_at"])
+    return [(_property_owner_id(values["property_id"]), [(created.year, created.month)])]
+
+
+def _unit_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    # Число активных юнитов влияет на занятость за все месяцы.
+    return [(_property_owner_id(values["property_id"]), None)]
+
+
+def _property_targets(values: Dict[str, Any]) -> List[RollupTarget]:
+    # Название, тип, адрес и статус объекта хранятся в сводках за все месяцы.
+    return [(values["owner_id"], None)]
+
+
+# Модель -> (поля, от которых зависят сводки; какие сводки сбросить по этим полям).
+_ROLLUP_SOURCES = {
+    Booking: (("property_id", "check_in", "check_out"), _booking_targets),
+    FinanceRecord: (("owner_id", "property_id", "operation_date"), _finance_record_targets),
+    Expense: (("property_id", "unit_id", "expense_date"), _expense_targets),
+    MaintenanceTask: (("property_id", "created_at"), _maintenance_task_targets),
+    Unit: (("property_id",), _unit_targets),
+    Property: (("owner_id",), _property_targets),
+}
+
+
+def _invalidate(targets: List[RollupTarget]) -> None:
+    seen = set()
+    for owner_id, months in targets:
+        key = (owner_id, None if months is None else tuple(months))
+        if key in seen:
+            continue
+        seen.add(key)
+        invalidate_owner_rollup(owner_id, months)
+
+
+def remember_old_targets(sender, instance, raw=False, **kwargs):
+    instance._old_rollup_targets = []
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields, targets = _ROLLUP_SOURCES[sender]
+    old_values = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    if old_values is not None:
+        instance._old_rollup_targets = targets(old_values)
+
+
+def rollup_source_changed(sender, instance, **kwargs):
+    fields, targets = _ROLLUP_SOURCES[sender]
+    current = targets({field: getattr(instance, field) for field in fields})
+    _invalidate(current + instance.__dict__.pop("_old_rollup_targets", []))
+
+
+for _model in _ROLLUP_SOURCES:
+    pre_save.connect(remember_old_targets, sender=_model)
+    post_save.connect(rollup_source_changed, sender=_model)
+    post_delete.connect(rollup_source_changed, sender=_model)
@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.bookings.models import Booking, Guest
+from apps.properties.models import Property, Unit
+from .models import Owner, OwnerMonthlyRollup
+from .services import OWNER_ROLLUP_MAX_AGE, get_owner_rollup
+
+
+class OwnerRollupInvalidationTests(TestCase):
+    """
+    Сводки OwnerMonthlyRollup сбрасываются и по прежним значениям изменённых записей.
+    """
+
+    def setUp(self):
+        self.owner = Owner.objects.create(name="Owner")
+        self.property = Property.objects.create(
+            owner=self.owner,
+            type=Property.PropertyType.RESIDENTIAL_SHORT,
+            name="Flat",
+            city="Sochi",
+            address="Street 1",
+        )
+        self.unit = Unit.objects.create(property=self.property, type="room", code="U1")
+        self.booking = Booking.objects.create(
+            unit=self.unit,
+            property=self.property,
+            guest=Guest.objects.create(full_name="Guest"),
+            check_in=date(2025, 3, 1),
+            check_out=date(2025, 3, 15),
+            amount=Decimal("1000.00"),
+        )
+
+    def _occupancy(self, year, month):
+        rollup = get_owner_rollup(self.owner, year, month)
+        return rollup.properties_data[0]["stats"]["occupancy_avg"]
+
+    def test_moving_booking_rebuilds_old_month(self):
+        self.assertAlmostEqual(self._occupancy(2025, 3), 14 / 31)
+
+        self.booking.check_in = date(2025, 5, 1)
+        self.booking.check_out = date(2025, 5, 15)
+        self.booking.save()
+
+        self.assertFalse(
+            OwnerMonthlyRollup.objects.filter(owner=self.owner, year=2025, month=3).exists()
+        )
+        self.assertEqual(self._occupancy(2025, 3), 0.0)
+        self.assertAlmostEqual(self._occupancy(2025, 5), 14 / 31)
+
+    def test_renaming_property_rebuilds_rollup(self):
+        get_owner_rollup(self.owner, 2025, 3)
+
+        self.property.name = "Renamed"
+        self.property.save()
+
+        rollup = get_owner_rollup(self.owner, 2025, 3)
+        self.assertEqual(rollup.properties_data[0]["property"]["name"], "Renamed")
+
+    def test_moving_property_to_other_owner_drops_both_rollups(self):
+        other_owner = Owner.objects.create(name="Other")
+        get_owner_rollup(self.owner, 2025, 3)
+        get_owner_rollup(other_owner, 2025, 3)
+
+        self.property.owner = other_owner
+        self.property.save()
+
+        self.assertFalse(OwnerMonthlyRollup.objects.exists())
+        self.assertEqual(get_owner_rollup(self.owner, 2025, 3).properties_data, [])
+
+    def test_stale_rollup_of_open_month_is_rebuilt(self):
+        today = timezone.localdate()
+        rollup = get_owner_rollup(self.owner, today.year, today.month)
+        self.assertEqual(rollup.properties_data[0]["property"]["name"], "Flat")
+
+        # Изменение в обход сигналов: сводка о нём не знает.
+        Property.objects.filter(pk=self.property.pk).update(name="Renamed")
+        rollup = get_owner_rollup(self.owner, today.year, today.month)
+        self.assertEqual(rollup.properties_data[0]["property"]["name"], "Flat")
+
+        OwnerMonthlyRollup.objects.filter(pk=rollup.pk).update(
+            computed_at=timezone.now() - OWNER_ROLLUP_MAX_AGE - timedelta(minutes=1)
+        )
+        rollup = get_owner_rollup(self.owner, today.year, today.month)
+        self.assertEqual(rollup.properties_data[0]["property"]["name"], "Renamed")
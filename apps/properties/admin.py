@@ -18,6 +18,8 @@ class PropertyAdmin(admin.ModelAdmin):
     )
     list_filter = ("type", "status", "city", "is_active")
     search_fields = ("name", "address", "city", "district", "owner__name")
+    list_select_related = ("owner", "manager")
+    autocomplete_fields = ("owner", "manager")
 
 
 @admin.register(RoomType)
@@ -31,6 +33,8 @@ class RoomTypeAdmin(admin.ModelAdmin):
     )
     list_filter = ("property", "is_active")
     search_fields = ("name", "property__name")
+    list_select_related = ("property",)
+    autocomplete_fields = ("property",)
 
 
 @admin.register(Unit)
@@ -47,9 +51,13 @@ class UnitAdmin(admin.ModelAdmin):
     )
     list_filter = ("type", "status", "property")
     search_fields = ("code", "property__name")
+    list_select_related = ("property",)
+    autocomplete_fields = ("property", "room_type")
 
 
 @admin.register(UnitPhoto)
 class UnitPhotoAdmin(admin.ModelAdmin):
     list_display = ("id", "unit", "caption", "created_at")
     list_filter = ("unit",)
+    list_select_related = ("unit", "unit__property")
+    raw_id_fields = ("unit",)
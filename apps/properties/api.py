@@ -1,148 +1,72 @@
-import calendar
-from collections import defaultdict
 from datetime import date
-from decimal import Decimal
 
+from django.db.models import (
+    CharField,
+    Count,
+    DateField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Greatest, Least
 from django.utils import timezone
 from rest_framework import serializers, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.bookings.models import Booking, CalendarEvent
 from apps.finance.models import FinanceRecord
+from apps.finance.services import get_period_bounds
 from apps.operations.models import (
+    CheckinTask,
+    CheckoutTask,
     CleaningTask,
     MaintenanceTask,
+    OwnerRequestTask,
     QualityInspectionTask,
     TaskBaseModel,
 )
 from apps.staff.models import Staff
 from apps.staff.permissions import IsPropertyManagerDashboardRole
 from .models import Property, RoomType, Unit, UnitPhoto
+from .pagination import CardBookingsPagination, UnitCardBookingsPagination
+from .renderers import ORJSONRenderer
+from .services import (
+    calculate_hotel_stats,
+    calculate_hotel_stats_bulk,
+    hotel_day_rows,
+    period_days_iso,
+    with_rooms_total,
+)
 
 
-def calculate_hotel_stats(prop: Property, year: int, month: int) -> dict:
-    """
-    Считает помесячные метрики по отелю:
-    - summary (occupancy_avg, adr_avg, revpar_avg, rooms_revenue_total);
-    - разрез по дням (occupancy, adr, revpar).
+def parse_period(request, today: date) -> tuple[int, int]:
     """
-    period_start = date(year, month, 1)
-    last_day = calendar.monthrange(year, month)[1]
-    period_end = date(year, month, last_day)
-
-    # Всего активных номеров в отеле.
-    rooms_total = prop.units.filter(
-        status=Unit.Status.ACTIVE,
-        is_active=True,
-    ).count()
-
-    # Подготовка структур для накопления данных по дням.
-    day_units: dict[date, set[int]] = defaultdict(set)
-    day_revenue: dict[date, Decimal] = defaultdict(lambda: Decimal("0.00"))
-
-    # Все бронирования, пересекающиеся с периодом.
-    bookings_qs = Booking.objects.filter(
-        property=prop,
-        check_in__lt=period_end,
-        check_out__gt=period_start,
-    ).select_related("unit")
-
-    for booking in bookings_qs:
-        total_nights = (booking.check_out - booking.check_in).days
-        if total_nights <= 0:
-            continue
-
-        revenue_per_night = (booking.amount or Decimal("0.00")) / total_nights
-
-        # Диапазон ночей в рамках интересующего нас периода.
-        start = max(booking.check_in, period_start)
-        end = min(booking.check_out, period_end + timezone.timedelta(days=1))
-
-        current = start
-        while current < end and current <= period_end:
-            day_units[current].add(booking.unit_id)
-            day_revenue[current] += revenue_per_night
-            current += timezone.timedelta(days=1)
-
-    # Формируем список дней с метриками.
-    days_data = []
-    current = period_start
-    occupancy_values = []
-    total_rooms_revenue = Decimal("0.00")
-    total_rooms_occupied = 0
-    days_in_period = (period_end - period_start).days + 1
-
-    while current <= period_end:
-        occupied = len(day_units.get(current, set()))
-        revenue = day_revenue.get(current, Decimal("0.00"))
-
-        if rooms_total > 0:
-            occupancy = occupied / rooms_total
-        else:
-            occupancy = None
-
-        if occupied > 0:
-            adr = revenue / occupied
-        else:
-            adr = None
+    Год и месяц из query-параметров year / month — общий контракт для всех
+    эндпоинтов с периодом (карточки, дашборды, загрузка отелей).
 
-        if rooms_total > 0:
-            revpar = revenue / rooms_total
-        else:
-            revpar = None
-
-        days_data.append(
-            {
-                "date": current.isoformat(),
-                "rooms_total": rooms_total,
-                "rooms_occupied": occupied,
-                "occupancy": float(occupancy) if occupancy is not None else None,
-                "rooms_revenue": float(revenue),
-                "adr": float(adr) if adr is not None else None,
-                "revpar": float(revpar) if revpar is not None else None,
-            }
-        )
+    Некорректные значения и год вне 1–9999 заменяются текущими,
+    месяц ограничивается 1–12.
+    """
+    try:
+        year = int(request.query_params.get("year", today.year))
+    except (TypeError, ValueError):
+        year = today.year
+    if not date.min.year <= year <= date.max.year:
+        year = today.year
+    try:
+        month = int(request.query_params.get("month", today.month))
+    except (TypeError, ValueError):
+        month = today.month
 
-        if occupancy is not None:
-            occupancy_values.append(occupancy)
-        total_rooms_revenue += revenue
-        total_rooms_occupied += occupied
-
-        current += timezone.timedelta(days=1)
-
-    # Агрегаты по периоду.
-    if occupancy_values:
-        occupancy_avg = sum(occupancy_values) / len(occupancy_values)
-    else:
-        occupancy_avg = None
-
-    if total_rooms_occupied > 0:
-        adr_avg = total_rooms_revenue / total_rooms_occupied
-    else:
-        adr_avg = None
-
-    if rooms_total > 0 and days_in_period > 0:
-        revpar_avg = total_rooms_revenue / (rooms_total * days_in_period)
-    else:
-        revpar_avg = None
-
-    summary = {
-        "rooms_total": rooms_total,
-        "rooms_revenue_total": float(total_rooms_revenue),
-        "occupancy_avg": float(occupancy_avg) if occupancy_avg is not None else None,
-        "adr_avg": float(adr_avg) if adr_avg is not None else None,
-        "revpar_avg": float(revpar_avg) if revpar_avg is not None else None,
-    }
-
-    return {
-        "property_id": prop.id,
-        "period": {"year": year, "month": month},
-        "summary": summary,
-        "days": days_data,
-    }
+    return year, max(1, min(12, month))
 
 
 class PropertySerializer(serializers.ModelSerializer):
@@ -165,6 +89,12 @@ class PropertySerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class PhotoMiniSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UnitPhoto
+        fields = ["id", "image", "caption", "created_at"]
+
+
 class UnitSerializer(serializers.ModelSerializer):
     photos = serializers.SerializerMethodField()
     room_type = serializers.PrimaryKeyRelatedField(
@@ -192,14 +122,106 @@ class UnitSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
     def get_photos(self, obj):
-        photos = obj.photos.all()
+        # photos.all() берёт данные из prefetch_related("photos"), если он задан.
+        return PhotoMiniSerializer(obj.photos.all(), many=True).data
+
+
+class BookingMiniSerializer(serializers.ModelSerializer):
+    """
+    Краткое представление брони в карточке объекта и панели GM.
+    """
+
+    class Meta:
+        model = Booking
+        fields = [
+            "id",
+            "unit",
+            "guest",
+            "check_in",
+            "check_out",
+            "status",
+            "source",
+            "amount",
+            "currency",
+        ]
+
+
+class UnitBookingMiniSerializer(serializers.ModelSerializer):
+    """
+    Краткое представление брони в карточке юнита.
+    """
+
+    class Meta:
+        model = Booking
+        fields = [
+            "id",
+            "property",
+            "guest",
+            "check_in",
+            "check_out",
+            "status",
+            "source",
+            "amount",
+            "currency",
+        ]
+
+
+class UnitTaskMiniSerializer(serializers.Serializer):
+    """
+    Краткое представление задачи любого типа (CleaningTask, MaintenanceTask, ...).
+
+    TaskBaseModel абстрактная, поэтому ModelSerializer к ней не применим —
+    поля перечислены явно.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    task_type = serializers.CharField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    priority = serializers.CharField(read_only=True)
+    executor = serializers.PrimaryKeyRelatedField(read_only=True)
+    deadline = serializers.DateTimeField(read_only=True)
+
 
-        class PhotoMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = UnitPhoto
-                fields = ["id", "image", "caption", "created_at"]
+class TaskMiniSerializer(UnitTaskMiniSerializer):
+    unit = serializers.PrimaryKeyRelatedField(read_only=True)
 
-        return PhotoMiniSerializer(photos, many=True).data
+
+class PropertyTaskMiniSerializer(TaskMiniSerializer):
+    booking = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
+class CalendarEventMiniSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CalendarEvent
+        fields = [
+            "id",
+            "event_type",
+            "start_date",
+            "end_date",
+            "booking",
+            "note",
+        ]
+
+
+# Статусы задач, которые считаются активными (в работе).
+ACTIVE_TASK_STATUSES = (
+    TaskBaseModel.Status.NEW,
+    TaskBaseModel.Status.IN_PROGRESS,
+)
+
+# Колонки для .only() под мини-сериализаторы: связи отдаются первичными
+# ключами, так что JOIN не нужен, а остальные колонки строк не читаем.
+UNIT_TASK_MINI_FIELDS = list(UnitTaskMiniSerializer().fields)
+TASK_MINI_FIELDS = list(TaskMiniSerializer().fields)
+PROPERTY_TASK_MINI_FIELDS = list(PropertyTaskMiniSerializer().fields)
+
+# Задачи во вкладке "Операции" карточки объекта.
+CARD_TASK_MODELS = (
+    ("cleaning", CleaningTask),
+    ("maintenance", MaintenanceTask),
+    ("quality", QualityInspectionTask),
+)
 
 
 class PropertyViewSet(viewsets.ModelViewSet):
@@ -209,6 +231,9 @@ class PropertyViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         qs = super().get_queryset()
+        if self.action == "hotel_occupancy":
+            # Число номеров приходит вместе с объектом — без отдельного COUNT.
+            qs = with_rooms_total(qs)
         user = self.request.user
         if not user.is_authenticated:
             return qs
@@ -254,20 +279,80 @@ class PropertyViewSet(viewsets.ModelViewSet):
             )
 
         now = timezone.now().date()
-        try:
-            year = int(request.query_params.get("year", now.year))
-        except (TypeError, ValueError):
-            year = now.year
-        try:
-            month = int(request.query_params.get("month", now.month))
-        except (TypeError, ValueError):
-            month = now.month
-
-        month = max(1, min(12, month))
+        year, month = parse_period(request, now)
         data = calculate_hotel_stats(prop, year, month)
         return Response(data)
 
-    @action(detail=True, methods=["get"], url_path="card")
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="occupancy-heatmap",
+        renderer_classes=[ORJSONRenderer, BrowsableAPIRenderer],
+    )
+    def occupancy_heatmap(self, request):
+        """
+        Тепловая карта загрузки: занятые юниты по дням месяца для всех
+        доступных пользователю объектов.
+
+        Параметры:
+          - year (int)
+          - month (int, 1–12)
+        По умолчанию — текущий месяц.
+        Ответ:
+        {
+          "period": {"year": ..., "month": ...},
+          "dates": ["YYYY-MM-DD", ...],
+          "properties": [
+            {"id": ..., "name": ..., "rooms_total": N, "rooms_occupied": [M, ...]},
+            ...
+          ]
+        }
+        Объекты читаются кортежами, занятость — одним сырым SQL-запросом
+        по всем объектам сразу, без создания моделей.
+        """
+        now = timezone.now().date()
+        year, month = parse_period(request, now)
+        period_start, period_end = get_period_bounds(year, month)
+        days_in_period = (period_end - period_start).days + 1
+
+        properties = list(
+            with_rooms_total(self.filter_queryset(self.get_queryset()))
+            .order_by("name", "id")
+            .values_list("id", "name", "rooms_total")
+        )
+
+        occupied_by_property = {
+            property_id: [0] * days_in_period for property_id, _name, _rooms in properties
+        }
+        if occupied_by_property:
+            start_ord = period_start.toordinal()
+            for property_id, day, occupied, _revenue_cents in hotel_day_rows(
+                list(occupied_by_property), period_start, period_end
+            ):
+                occupied_by_property[property_id][day.toordinal() - start_ord] = occupied
+
+        return Response(
+            {
+                "period": {"year": year, "month": month},
+                "dates": period_days_iso(period_start, days_in_period),
+                "properties": [
+                    {
+                        "id": property_id,
+                        "name": name,
+                        "rooms_total": rooms_total,
+                        "rooms_occupied": occupied_by_property[property_id],
+                    }
+                    for property_id, name, rooms_total in properties
+                ],
+            }
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="card",
+        renderer_classes=[ORJSONRenderer, BrowsableAPIRenderer],
+    )
     def card(self, request, pk=None):
         """
         Карточка объекта Property с агрегированными данными.
@@ -281,142 +366,113 @@ class PropertyViewSet(viewsets.ModelViewSet):
 
         # Период.
         now = timezone.now().date()
-        try:
-            year = int(request.query_params.get("year", now.year))
-        except (TypeError, ValueError):
-            year = now.year
-        try:
-            month = int(request.query_params.get("month", now.month))
-        except (TypeError, ValueError):
-            month = now.month
-
-        month = max(1, min(12, month))
-        period_start = date(year, month, 1)
-        last_day = calendar.monthrange(year, month)[1]
-        period_end = date(year, month, last_day)
+        year, month = parse_period(request, now)
+        period_start, period_end = get_period_bounds(year, month)
 
         # Юниты.
-        units_qs = prop.units.all()
-        units_data = UnitSerializer(units_qs, many=True).data
+        units_qs = prop.units.prefetch_related("photos")
 
         # Текущие и будущие бронирования по объекту.
         today = now
         bookings_qs = (
             Booking.objects.filter(property=prop, check_out__gte=today)
-            .select_related("unit", "guest")
+            .only(*BookingMiniSerializer.Meta.fields)
             .order_by("check_in")
         )
 
-        class BookingMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = Booking
-                fields = [
-                    "id",
-                    "unit",
-                    "guest",
-                    "check_in",
-                    "check_out",
-                    "status",
-                    "source",
-                    "amount",
-                    "currency",
-                ]
-
-        bookings_data = BookingMiniSerializer(bookings_qs, many=True).data
-
-        # Активные задачи по объекту.
-        active_statuses = [
-            TaskBaseModel.Status.NEW,
-            TaskBaseModel.Status.IN_PROGRESS,
+        # Активные задачи по объекту: три модели с общими колонками
+        # TaskBaseModel — одним запросом через UNION ALL. Строки приходят
+        # экземплярами первой модели, поэтому источник помечаем в kind.
+        task_qs = [
+            model.objects.filter(property=prop, status__in=ACTIVE_TASK_STATUSES)
+            .only(*PROPERTY_TASK_MINI_FIELDS, "created_at")
+            .annotate(kind=Value(key, output_field=CharField()))
+            .order_by()
+            for key, model in CARD_TASK_MODELS
         ]
-
-        cleaning_qs = CleaningTask.objects.filter(
-            property=prop, status__in=active_statuses
-        ).select_related("unit", "executor")
-        maintenance_qs = MaintenanceTask.objects.filter(
-            property=prop, status__in=active_statuses
-        ).select_related("unit", "executor")
-        quality_qs = QualityInspectionTask.objects.filter(
-            property=prop, status__in=active_statuses
-        ).select_related("unit", "executor")
-
-        class TaskMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = TaskBaseModel
-                fields = [
-                    "id",
-                    "task_type",
-                    "title",
-                    "status",
-                    "priority",
-                    "executor",
-                    "unit",
-                    "booking",
-                    "deadline",
-                ]
-
-        cleaning_data = TaskMiniSerializer(cleaning_qs, many=True).data
-        maintenance_data = TaskMiniSerializer(maintenance_qs, many=True).data
-        quality_data = TaskMiniSerializer(quality_qs, many=True).data
-
-        # Статистика загрузки (occupancy) за период.
-        period_bookings = Booking.objects.filter(
-            property=prop,
-            check_in__lte=period_end,
-            check_out__gte=period_start,
-        )
-
-        total_nights = (period_end - period_start).days + 1
-        booked_nights = 0
-
-        for b in period_bookings:
-            start = max(b.check_in, period_start)
-            end = min(b.check_out, period_end)
-            delta = (end - start).days
-            if delta > 0:
-                booked_nights += delta
-
-        occupancy_percent = (
-            round(booked_nights / total_nights * 100, 2) if total_nights > 0 else 0.0
-        )
+        tasks_qs = task_qs[0].union(*task_qs[1:], all=True).order_by("-created_at")
 
         # Финансовая статистика по FinanceRecord за период.
-        fin_qs = FinanceRecord.objects.filter(
-            property=prop,
-            operation_date__gte=period_start,
-            operation_date__lte=period_end,
-        )
-
-        finance_summary = []
-        for row in (
-            fin_qs.values("currency")
+        finance_qs = (
+            FinanceRecord.objects.filter(
+                property=prop,
+                operation_date__gte=period_start,
+                operation_date__lte=period_end,
+            )
+            .values("currency")
             .annotate(
-                income_total=models.Sum(
+                income_total=Sum(
                     "amount",
-                    filter=models.Q(
+                    filter=Q(
                         record_type=FinanceRecord.RecordType.INCOME,
                     ),
+                    default=0,
                 ),
-                expense_total=models.Sum(
+                expense_total=Sum(
                     "amount",
-                    filter=models.Q(
+                    filter=Q(
                         record_type=FinanceRecord.RecordType.EXPENSE,
                     ),
+                    default=0,
                 ),
+                net_total=F("income_total") - F("expense_total"),
             )
+            .values("currency", "income_total", "expense_total", "net_total")
             .order_by("currency")
-        ):
-            income = row["income_total"] or 0
-            expense = row["expense_total"] or 0
-            net = income - expense
-            finance_summary.append(
-                {
-                    "currency": row["currency"],
-                    "income_total": income,
-                    "expense_total": expense,
-                    "net_total": net,
-                }
+        )
+
+        # Страницу бронирований (если запрошена) отдаёт пагинатор.
+        bookings_pagination = CardBookingsPagination()
+        bookings_page = None
+        if bookings_pagination.is_requested(request):
+            bookings_page = bookings_pagination.paginate_queryset(
+                bookings_qs, request, view=self
             )
+            bookings = bookings_page
+        else:
+            bookings = list(bookings_qs)
+
+        units = list(units_qs)
+        tasks = list(tasks_qs)
+        finance_summary = list(finance_qs)
+
+        tasks_by_kind = {key: [] for key, _model in CARD_TASK_MODELS}
+        for task in tasks:
+            tasks_by_kind[task.kind].append(task)
+
+        units_data = UnitSerializer(units, many=True).data
+        bookings_data = BookingMiniSerializer(bookings, many=True).data
+        cleaning_data = PropertyTaskMiniSerializer(tasks_by_kind["cleaning"], many=True).data
+        maintenance_data = PropertyTaskMiniSerializer(
+            tasks_by_kind["maintenance"], many=True
+        ).data
+        quality_data = PropertyTaskMiniSerializer(tasks_by_kind["quality"], many=True).data
+
+        # Статистика загрузки (occupancy) за период: пересечение каждой брони
+        # с периодом суммируем в БД.
+        total_nights = (period_end - period_start).days + 1
+        booked = (
+            Booking.objects.filter(
+                property=prop,
+                check_in__lt=period_end,
+                check_out__gt=period_start,
+            )
+            .filter(check_out__gt=F("check_in"))
+            .aggregate(
+                nights=Sum(
+                    ExpressionWrapper(
+                        Least("check_out", Value(period_end, output_field=DateField()))
+                        - Greatest("check_in", Value(period_start, output_field=DateField())),
+                        output_field=DurationField(),
+                    )
+                )
+            )["nights"]
+        )
+        booked_nights = booked.days if booked else 0
+
+        occupancy_percent = (
+            round(booked_nights / total_nights * 100, 2) if total_nights > 0 else 0.0
+        )
 
         # Вкладка "Собственник".
         owner = prop.owner
@@ -428,30 +484,36 @@ class PropertyViewSet(viewsets.ModelViewSet):
             "status": owner.status,
         }
 
-        return Response(
-            {
-                "property": PropertySerializer(prop).data,
-                "period": {"year": year, "month": month},
-                "units": units_data,
-                "bookings": bookings_data,
-                "tasks": {
-                    "cleaning": cleaning_data,
-                    "maintenance": maintenance_data,
-                    "quality_inspection": quality_data,
-                },
-                "stats": {
-                    "total_nights": total_nights,
-                    "booked_nights": booked_nights,
-                    "occupancy_percent": occupancy_percent,
-                },
-                "finance_summary": finance_summary,
-                "owner": owner_data,
-            }
-        )
+        data = {
+            "property": PropertySerializer(prop).data,
+            "period": {"year": year, "month": month},
+            "units": units_data,
+            "bookings": bookings_data,
+            "tasks": {
+                "cleaning": cleaning_data,
+                "maintenance": maintenance_data,
+                "quality_inspection": quality_data,
+            },
+            "stats": {
+                "total_nights": total_nights,
+                "booked_nights": booked_nights,
+                "occupancy_percent": occupancy_percent,
+            },
+            "finance_summary": finance_summary,
+            "owner": owner_data,
+        }
+        if bookings_page is not None:
+            data["bookings_next"] = bookings_pagination.get_next_link()
+            data["bookings_previous"] = bookings_pagination.get_previous_link()
+        return Response(data)
 
 
 class UnitViewSet(viewsets.ModelViewSet):
-    queryset = Unit.objects.select_related("property", "property__owner").all()
+    queryset = (
+        Unit.objects.select_related("property", "property__owner")
+        .prefetch_related("photos")
+        .all()
+    )
     serializer_class = UnitSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -474,7 +536,12 @@ class UnitViewSet(viewsets.ModelViewSet):
 
         return qs
 
-    @action(detail=True, methods=["get"], url_path="card")
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="card",
+        renderer_classes=[ORJSONRenderer, BrowsableAPIRenderer],
+    )
     def card(self, request, pk=None):
         """
         Карточка юнита Unit.
@@ -494,19 +561,8 @@ class UnitViewSet(viewsets.ModelViewSet):
         unit = self.get_object()
 
         now = timezone.now().date()
-        try:
-            year = int(request.query_params.get("year", now.year))
-        except (TypeError, ValueError):
-            year = now.year
-        try:
-            month = int(request.query_params.get("month", now.month))
-        except (TypeError, ValueError):
-            month = now.month
-
-        month = max(1, min(12, month))
-        period_start = date(year, month, 1)
-        last_day = calendar.monthrange(year, month)[1]
-        period_end = date(year, month, last_day)
+        year, month = parse_period(request, now)
+        period_start, period_end = get_period_bounds(year, month)
 
         # Базовые данные по юниту.
         unit_data = UnitSerializer(unit).data
@@ -516,7 +572,7 @@ class UnitViewSet(viewsets.ModelViewSet):
             unit=unit,
             start_date__lte=period_end,
             end_date__gte=period_start,
-        ).select_related("booking")
+        ).only(*CalendarEventMiniSerializer.Meta.fields)
 
         event_type_filter = request.query_params.get("event_type")
         if event_type_filter:
@@ -524,100 +580,63 @@ class UnitViewSet(viewsets.ModelViewSet):
             if types:
                 cal_events = cal_events.filter(event_type__in=types)
 
-        class CalendarEventSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = CalendarEvent
-                fields = [
-                    "id",
-                    "event_type",
-                    "start_date",
-                    "end_date",
-                    "booking",
-                    "note",
-                ]
-
-        calendar_data = CalendarEventSerializer(cal_events, many=True).data
-
-        # История бронирований по юниту (можно ограничить последними N).
-        bookings_qs = (
-            Booking.objects.filter(unit=unit)
-            .select_related("guest", "property")
-            .order_by("-check_in", "-id")[:100]
-        )
+        calendar_data = CalendarEventMiniSerializer(cal_events, many=True).data
 
-        class BookingMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = Booking
-                fields = [
-                    "id",
-                    "property",
-                    "guest",
-                    "check_in",
-                    "check_out",
-                    "status",
-                    "source",
-                    "amount",
-                    "currency",
-                ]
+        # История бронирований по юниту: последние 100 либо страница по
+        # bookings_limit / bookings_cursor.
+        bookings_qs = Booking.objects.filter(unit=unit).only(
+            *UnitBookingMiniSerializer.Meta.fields
+        )
+        bookings_pagination = UnitCardBookingsPagination()
+        if bookings_pagination.is_requested(request):
+            bookings = bookings_pagination.paginate_queryset(bookings_qs, request, view=self)
+        else:
+            bookings = bookings_qs.order_by("-check_in", "-id")[:100]
 
-        bookings_data = BookingMiniSerializer(bookings_qs, many=True).data
+        bookings_data = UnitBookingMiniSerializer(bookings, many=True).data
 
         # Активные и последние задачи по клинингу и ремонту.
-        active_statuses = [
-            TaskBaseModel.Status.NEW,
-            TaskBaseModel.Status.IN_PROGRESS,
-        ]
-
         cleaning_active = CleaningTask.objects.filter(
-            unit=unit, status__in=active_statuses
-        ).select_related("executor")
+            unit=unit, status__in=ACTIVE_TASK_STATUSES
+        ).only(*UNIT_TASK_MINI_FIELDS)
         maintenance_active = MaintenanceTask.objects.filter(
-            unit=unit, status__in=active_statuses
-        ).select_related("executor")
+            unit=unit, status__in=ACTIVE_TASK_STATUSES
+        ).only(*UNIT_TASK_MINI_FIELDS)
 
         cleaning_recent = (
             CleaningTask.objects.filter(unit=unit)
-            .exclude(id__in=cleaning_active.values_list("id", flat=True))
+            .exclude(status__in=ACTIVE_TASK_STATUSES)
+            .only(*UNIT_TASK_MINI_FIELDS)
             .order_by("-created_at")[:20]
         )
         maintenance_recent = (
             MaintenanceTask.objects.filter(unit=unit)
-            .exclude(id__in=maintenance_active.values_list("id", flat=True))
+            .exclude(status__in=ACTIVE_TASK_STATUSES)
+            .only(*UNIT_TASK_MINI_FIELDS)
             .order_by("-created_at")[:20]
         )
 
-        class TaskMiniSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = TaskBaseModel
-                fields = [
-                    "id",
-                    "task_type",
-                    "title",
-                    "status",
-                    "priority",
-                    "executor",
-                    "deadline",
-                ]
-
-        cleaning_active_data = TaskMiniSerializer(cleaning_active, many=True).data
-        maintenance_active_data = TaskMiniSerializer(maintenance_active, many=True).data
-        cleaning_recent_data = TaskMiniSerializer(cleaning_recent, many=True).data
-        maintenance_recent_data = TaskMiniSerializer(maintenance_recent, many=True).data
-
-        return Response(
-            {
-                "unit": unit_data,
-                "period": {"year": year, "month": month},
-                "calendar": calendar_data,
-                "bookings": bookings_data,
-                "tasks": {
-                    "cleaning_active": cleaning_active_data,
-                    "maintenance_active": maintenance_active_data,
-                    "cleaning_recent": cleaning_recent_data,
-                    "maintenance_recent": maintenance_recent_data,
-                },
-            }
-        )
+        cleaning_active_data = UnitTaskMiniSerializer(cleaning_active, many=True).data
+        maintenance_active_data = UnitTaskMiniSerializer(maintenance_active, many=True).data
+        cleaning_recent_data = UnitTaskMiniSerializer(cleaning_recent, many=True).data
+        maintenance_recent_data = UnitTaskMiniSerializer(maintenance_recent, many=True).data
+
+        data = {
+            "unit": unit_data,
+            "period": {"year": year, "month": month},
+            "calendar": calendar_data,
+            "bookings": bookings_data,
+            "tasks": {
+                "cleaning_active": cleaning_active_data,
+                "maintenance_active": maintenance_active_data,
+                "cleaning_recent": cleaning_recent_data,
+                "maintenance_recent": maintenance_recent_data,
+            },
+        }
+        if bookings_pagination.is_requested(request):
+            data["bookings_next"] = bookings_pagination.get_next_link()
+            data["bookings_previous"] = bookings_pagination.get_previous_link()
+        return Response(data)
 
 
 class GMDashboardView(APIView):
@@ -632,16 +651,7 @@ class GMDashboardView(APIView):
 
     def get(self, request, *args, **kwargs):
         now = timezone.now().date()
-        try:
-            year = int(request.query_params.get("year", now.year))
-        except (TypeError, ValueError):
-            year = now.year
-        try:
-            month = int(request.query_params.get("month", now.month))
-        except (TypeError, ValueError):
-            month = now.month
-
-        month = max(1, min(12, month))
+        year, month = parse_period(request, now)
 
         user = request.user
         try:
@@ -664,10 +674,30 @@ class GMDashboardView(APIView):
                 id__in=staff.properties.values_list("id", flat=True),
                 type=Property.PropertyType.HOTEL,
             )
+            .prefetch_related(
+                Prefetch("units", queryset=Unit.objects.prefetch_related("photos")),
+                # Активные задачи по клинингу и эксплуатации — одним запросом
+                # на модель для всех отелей.
+                Prefetch(
+                    "operations_cleaningtask_tasks",
+                    queryset=CleaningTask.objects.filter(
+                        status__in=ACTIVE_TASK_STATUSES
+                    ).only(*TASK_MINI_FIELDS, "property"),
+                    to_attr="active_cleaning_tasks",
+                ),
+                Prefetch(
+                    "operations_maintenancetask_tasks",
+                    queryset=MaintenanceTask.objects.filter(
+                        status__in=ACTIVE_TASK_STATUSES
+                    ).only(*TASK_MINI_FIELDS, "property"),
+                    to_attr="active_maintenance_tasks",
+                ),
+            )
             .order_by("name")
         )
+        properties = list(with_rooms_total(properties_qs))
 
-        if not properties_qs.exists():
+        if not properties:
             return Response(
                 {
                     "detail": (
@@ -678,76 +708,38 @@ class GMDashboardView(APIView):
                 status=400,
             )
 
-        active_statuses = [
-            TaskBaseModel.Status.NEW,
-            TaskBaseModel.Status.IN_PROGRESS,
-        ]
+        # Статистика загрузки и выручки по всем отелям за период — одним запросом.
+        hotel_stats = calculate_hotel_stats_bulk(properties, year, month)
+
+        properties_data = PropertySerializer(properties, many=True).data
 
         dashboard_properties = []
 
-        for prop in properties_qs:
-            # Статистика загрузки и выручки по отелю за период.
-            stats = calculate_hotel_stats(prop, year, month)
+        for prop, prop_data in zip(properties, properties_data):
+            stats = hotel_stats[prop.id]
 
-            # Юниты отеля.
-            units_qs = prop.units.all()
-            units_data = UnitSerializer(units_qs, many=True).data
+            # Юниты отеля (с фото) уже загружены prefetch_related.
+            units_data = UnitSerializer(prop.units.all(), many=True).data
 
             # Текущие и будущие бронирования по отелю.
             today = now
             bookings_qs = (
                 Booking.objects.filter(property=prop, check_out__gte=today)
-                .select_related("unit", "guest")
+                .only(*BookingMiniSerializer.Meta.fields)
                 .order_by("check_in")
             )
 
-            class BookingMiniSerializer(serializers.ModelSerializer):
-                class Meta:
-                    model = Booking
-                    fields = [
-                        "id",
-                        "unit",
-                        "guest",
-                        "check_in",
-                        "check_out",
-                        "status",
-                        "source",
-                        "amount",
-                        "currency",
-                    ]
-
             bookings_data = BookingMiniSerializer(bookings_qs, many=True).data
 
             # Активные задачи по клинингу и эксплуатации по отелю.
-            cleaning_qs = CleaningTask.objects.filter(
-                property=prop,
-                status__in=active_statuses,
-            ).select_related("unit", "executor")
-            maintenance_qs = MaintenanceTask.objects.filter(
-                property=prop,
-                status__in=active_statuses,
-            ).select_related("unit", "executor")
-
-            class TaskMiniSerializer(serializers.ModelSerializer):
-                class Meta:
-                    model = TaskBaseModel
-                    fields = [
-                        "id",
-                        "task_type",
-                        "title",
-                        "status",
-                        "priority",
-                        "executor",
-                        "unit",
-                        "deadline",
-                    ]
-
-            cleaning_data = TaskMiniSerializer(cleaning_qs, many=True).data
-            maintenance_data = TaskMiniSerializer(maintenance_qs, many=True).data
+            cleaning_data = TaskMiniSerializer(prop.active_cleaning_tasks, many=True).data
+            maintenance_data = TaskMiniSerializer(
+                prop.active_maintenance_tasks, many=True
+            ).data
 
             dashboard_properties.append(
                 {
-                    "property": PropertySerializer(prop).data,
+                    "property": prop_data,
                     "units": units_data,
                     "bookings": bookings_data,
                     "tasks": {
@@ -761,6 +753,17 @@ class GMDashboardView(APIView):
         return Response({"properties": dashboard_properties})
 
 
+# Модели задач в разрезе by_type панели Property Manager.
+DASHBOARD_TASK_MODELS = (
+    ("cleaning", CleaningTask),
+    ("maintenance", MaintenanceTask),
+    ("checkin", CheckinTask),
+    ("checkout", CheckoutTask),
+    ("quality", QualityInspectionTask),
+    ("owner_request", OwnerRequestTask),
+)
+
+
 class PropertyManagerDashboardView(APIView):
     """
     Панель Property Manager (CRM).
@@ -773,16 +776,7 @@ class PropertyManagerDashboardView(APIView):
     def get(self, request, *args, **kwargs):
         now = timezone.now()
         today = now.date()
-        try:
-            year = int(request.query_params.get("year", today.year))
-        except (TypeError, ValueError):
-            year = today.year
-        try:
-            month = int(request.query_params.get("month", today.month))
-        except (TypeError, ValueError):
-            month = today.month
-
-        month = max(1, min(12, month))
+        year, month = parse_period(request, today)
 
         try:
             staff: Staff = request.user.staff_profile  # type: ignore[attr-defined]
@@ -801,10 +795,31 @@ class PropertyManagerDashboardView(APIView):
                 .order_by("name")
             )
 
-        active_statuses = [
-            TaskBaseModel.Status.NEW,
-            TaskBaseModel.Status.IN_PROGRESS,
+        # Активные и просроченные задачи: GROUP BY property_id по каждой модели
+        # задач, объединённые через UNION ALL в один запрос.
+        task_counts_qs = [
+            model.objects.filter(property__in=properties_qs, status__in=ACTIVE_TASK_STATUSES)
+            .values("property_id")
+            .annotate(
+                kind=Value(key, output_field=CharField()),
+                active=Count("id"),
+                overdue=Count("id", filter=Q(deadline__lt=now)),
+            )
+            .order_by()
+            for key, model in DASHBOARD_TASK_MODELS
         ]
+        task_counts = {}
+        for row in task_counts_qs[0].union(*task_counts_qs[1:], all=True):
+            task_counts[(row["property_id"], row["kind"])] = row
+
+        properties = list(with_rooms_total(properties_qs))
+        hotel_stats = calculate_hotel_stats_bulk(
+            [prop for prop in properties if prop.type == Property.PropertyType.HOTEL],
+            year,
+            month,
+        )
+
+        serialized_properties = PropertySerializer(properties, many=True).data
 
         properties_data = []
 
@@ -816,11 +831,10 @@ class PropertyManagerDashboardView(APIView):
         total_rooms_revenue = 0.0
         total_rooms = 0
 
-        for prop in properties_qs:
+        for prop, prop_data in zip(properties, serialized_properties):
             # Загрузка / метрики по периоду.
             if prop.type == Property.PropertyType.HOTEL:
-                stats = calculate_hotel_stats(prop, year, month)
-                stats_summary = stats["summary"]
+                stats_summary = hotel_stats[prop.id]["summary"]
                 if stats_summary["rooms_total"]:
                     total_rooms += stats_summary["rooms_total"]
                 total_rooms_revenue += stats_summary["rooms_revenue_total"]
@@ -829,84 +843,30 @@ class PropertyManagerDashboardView(APIView):
             else:
                 stats_summary = None
 
-            # Задачи по объекту.
-            base_filter = {"property": prop, "status__in": active_statuses}
-            cleaning_qs = CleaningTask.objects.filter(**base_filter)
-            maintenance_qs = MaintenanceTask.objects.filter(**base_filter)
-            checkin_qs = CheckinTask.objects.filter(**base_filter)
-            checkout_qs = CheckoutTask.objects.filter(**base_filter)
-            quality_qs = QualityInspectionTask.objects.filter(**base_filter)
-            owner_req_qs = OwnerRequestTask.objects.filter(**base_filter)
-
-            cleaning_active = cleaning_qs.count()
-            maintenance_active = maintenance_qs.count()
-            checkin_active = checkin_qs.count()
-            checkout_active = checkout_qs.count()
-            quality_active = quality_qs.count()
-            owner_req_active = owner_req_qs.count()
-
-            overdue_filter = {"deadline__lt": now}
-            cleaning_overdue = cleaning_qs.filter(**overdue_filter).count()
-            maintenance_overdue = maintenance_qs.filter(**overdue_filter).count()
-            checkin_overdue = checkin_qs.filter(**overdue_filter).count()
-            checkout_overdue = checkout_qs.filter(**overdue_filter).count()
-            quality_overdue = quality_qs.filter(**overdue_filter).count()
-            owner_req_overdue = owner_req_qs.filter(**overdue_filter).count()
-
-            active_total = (
-                cleaning_active
-                + maintenance_active
-                + checkin_active
-                + checkout_active
-                + quality_active
-                + owner_req_active
-            )
-            overdue_total = (
-                cleaning_overdue
-                + maintenance_overdue
-                + checkin_overdue
-                + checkout_overdue
-                + quality_overdue
-                + owner_req_overdue
-            )
+            # Задачи по объекту — из заранее сгруппированных счётчиков.
+            by_type = {}
+            for key, _model in DASHBOARD_TASK_MODELS:
+                counts = task_counts.get((prop.id, key))
+                by_type[key] = {
+                    "active": counts["active"] if counts else 0,
+                    "overdue": counts["overdue"] if counts else 0,
+                }
+
+            active_total = sum(item["active"] for item in by_type.values())
+            overdue_total = sum(item["overdue"] for item in by_type.values())
 
             total_active_tasks += active_total
             total_overdue_tasks += overdue_total
 
             properties_data.append(
                 {
-                    "property": PropertySerializer(prop).data,
+                    "property": prop_data,
                     "period": {"year": year, "month": month},
                     "stats": stats_summary,
                     "tasks": {
                         "active_total": active_total,
                         "overdue_total": overdue_total,
-                        "by_type": {
-                            "cleaning": {
-                                "active": cleaning_active,
-                                "overdue": cleaning_overdue,
-                            },
-                            "maintenance": {
-                                "active": maintenance_active,
-                                "overdue": maintenance_overdue,
-                            },
-                            "checkin": {
-                                "active": checkin_active,
-                                "overdue": checkin_overdue,
-                            },
-                            "checkout": {
-                                "active": checkout_active,
-                                "overdue": checkout_overdue,
-                            },
-                            "quality": {
-                                "active": quality_active,
-                                "overdue": quality_overdue,
-                            },
-                            "owner_request": {
-                                "active": owner_req_active,
-                                "overdue": owner_req_overdue,
-                            },
-                        },
+                        "by_type": by_type,
                     },
                 }
             )
@@ -917,7 +877,7 @@ class PropertyManagerDashboardView(APIView):
             occupancy_avg = None
 
         summary = {
-            "properties_count": properties_qs.count(),
+            "properties_count": len(properties),
             "tasks_active_total": total_active_tasks,
             "tasks_overdue_total": total_overdue_tasks,
             "rooms_total": total_rooms,
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PropertiesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.properties"
+    verbose_name = "Объекты"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,29 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CardBookingsPagination(CursorPagination):
+    """
+    Курсорная пагинация списка бронирований в карточке объекта.
+
+    Включается только по query-параметрам bookings_limit / bookings_cursor,
+    без них карточка отдаёт список целиком, как раньше. Курсор не требует
+    COUNT(*) и не деградирует на глубоких страницах, в отличие от OFFSET.
+    """
+
+    cursor_query_param = "bookings_cursor"
+    page_size_query_param = "bookings_limit"
+    page_size = 100
+    max_page_size = 500
+    ordering = ("check_in", "id")
+
+    def is_requested(self, request) -> bool:
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+class UnitCardBookingsPagination(CardBookingsPagination):
+    """
+    То же для истории бронирований в карточке юнита: от новых к старым.
+    """
+
+    ordering = ("-check_in", "-id")
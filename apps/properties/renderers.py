@@ -0,0 +1,30 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - защита от отсутствия пакета
+    orjson = None  # type: ignore[assignment]
+
+
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON-рендерер на orjson для тяжёлых ответов (карточки, панели).
+
+    Типы, которых orjson не знает (Decimal, даты, lazy-строки), кодируются так же,
+    как в стандартном JSONRenderer DRF. Без пакета orjson, а также при запросе
+    форматированного вывода (indent) работает как обычный JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=JSONEncoder().default, option=_ORJSON_OPTIONS)
@@ -0,0 +1,380 @@
+import time
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.finance.services import get_period_bounds
+from .models import Property, Unit
+
+
+# Разбивка бронирований по ночам периода: на каждый день — число занятых
+# юнитов и выручка в копейках. Сумма брони переводится в целые копейки и
+# делится по ночам целочисленно, остаток раздаётся по копейке первым ночам —
+# так сумма по ночам всегда равна сумме брони. Учитываются те же брони,
+# что и раньше: check_in < period_end и check_out > period_start.
+_HOTEL_DAYS_SQL_POSTGRES = """
+    SELECT b.property_id, days.d, COUNT(DISTINCT b.unit_id),
+           SUM(b.cents / b.nights
+               + CASE WHEN days.d - b.check_in < b.cents %% b.nights THEN 1 ELSE 0 END)
+    FROM (
+        SELECT generate_series(%s::timestamp, %s::timestamp, interval '1 day')::date AS d
+    ) AS days
+    JOIN (
+        SELECT property_id, unit_id, check_in, check_out,
+               ROUND(amount * 100)::bigint AS cents,
+               check_out - check_in AS nights
+        FROM {table}
+        WHERE property_id IN ({property_ids})
+          AND check_in < %s
+          AND check_out > %s
+          AND check_out > check_in
+    ) AS b ON b.check_in <= days.d AND b.check_out > days.d
+    GROUP BY b.property_id, days.d
+"""
+
+_HOTEL_DAYS_SQL_SQLITE = """
+    WITH RECURSIVE days(d) AS (
+        SELECT date(%s)
+        UNION ALL
+        SELECT date(d, '+1 day') FROM days WHERE d < date(%s)
+    )
+    SELECT b.property_id, days.d, COUNT(DISTINCT b.unit_id),
+           SUM(b.cents / b.nights
+               + CASE
+                   WHEN CAST(julianday(days.d) - julianday(b.check_in) AS INTEGER)
+                        < b.cents %% b.nights
+                   THEN 1 ELSE 0
+                 END)
+    FROM days
+    JOIN (
+        SELECT property_id, unit_id, check_in, check_out,
+               CAST(ROUND(amount * 100) AS INTEGER) AS cents,
+               CAST(julianday(check_out) - julianday(check_in) AS INTEGER) AS nights
+        FROM {table}
+        WHERE property_id IN ({property_ids})
+          AND check_in < %s
+          AND check_out > %s
+          AND check_out > check_in
+    ) AS b ON b.check_in <= days.d AND b.check_out > days.d
+    GROUP BY b.property_id, days.d
+"""
+
+
+def hotel_day_rows(
+    property_ids: list[int], period_start: date, period_end: date
+) -> list[tuple[int, date, int, int]]:
+    """
+    Возвращает (объект, день, занято юнитов, выручка за день в копейках)
+    только по дням, на которые есть бронирования.
+    """
+    if connection.vendor == "postgresql":
+        sql = _HOTEL_DAYS_SQL_POSTGRES
+    else:
+        sql = _HOTEL_DAYS_SQL_SQLITE
+    sql = sql.format(
+        table=connection.ops.quote_name(Booking._meta.db_table),
+        property_ids=", ".join(["%s"] * len(property_ids)),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql,
+            [period_start, period_end, *property_ids, period_end, period_start],
+        )
+        rows = cursor.fetchall()
+
+    return [
+        (
+            property_id,
+            date.fromisoformat(day) if isinstance(day, str) else day,
+            occupied,
+            int(revenue_cents or 0),
+        )
+        for property_id, day, occupied, revenue_cents in rows
+    ]
+
+
+# Кэш метрик отеля за месяц. Ключ включает версию данных объекта, которую
+# сигналы по Booking/Unit меняют при любом изменении (см. signals.py), так что
+# устаревшие записи просто перестают читаться. Текущий и будущие месяцы
+# дополнительно живут не дольше HOTEL_STATS_CACHE_TIMEOUT.
+HOTEL_STATS_CACHE_TIMEOUT = 5 * 60
+
+# Кэши одного процесса: смена версии из другого воркера или management-команды
+# до них не доходит, поэтому без общего кэша (REDIS_URL) срок жизни конечен всегда.
+_PROCESS_LOCAL_CACHE_BACKENDS = frozenset(
+    {
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    }
+)
+
+
+def _past_month_stats_timeout() -> int | None:
+    if settings.CACHES["default"]["BACKEND"] in _PROCESS_LOCAL_CACHE_BACKENDS:
+        return HOTEL_STATS_CACHE_TIMEOUT
+    return None
+
+
+def _hotel_stats_version_key(property_id: int) -> str:
+    return f"hotelstats:version:{property_id}"
+
+
+def bump_hotel_stats_version(property_id: int | None) -> None:
+    """
+    Сбрасывает закэшированные метрики отеля за все периоды.
+    """
+    if not property_id:
+        return
+    cache.set(_hotel_stats_version_key(property_id), time.time_ns(), None)
+
+
+def _hotel_stats_versions(property_ids: list[int]) -> dict[int, int]:
+    version_keys = {_hotel_stats_version_key(pid): pid for pid in property_ids}
+    versions = {
+        version_keys[key]: version
+        for key, version in cache.get_many(list(version_keys)).items()
+    }
+    for key, pid in version_keys.items():
+        if pid not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[pid] = cache.get(key)
+    return versions
+
+
+def calculate_hotel_stats_bulk(props, year: int, month: int) -> dict[int, dict]:
+    """
+    Метрики calculate_hotel_stats сразу по нескольким отелям: property_id -> stats.
+
+    Берутся из кэша; недостающие считаются одним запросом по бронированиям
+    всех отелей и одним — по числу активных номеров. Если объекты получены
+    из queryset с with_rooms_total(), число номеров берётся из аннотации.
+    """
+    property_ids = [prop.id for prop in props]
+    if not property_ids:
+        return {}
+
+    versions = _hotel_stats_versions(property_ids)
+    cache_keys = {
+        pid: f"hotelstats:{pid}:{year}:{month}:{versions[pid]}" for pid in property_ids
+    }
+    cached = cache.get_many(list(cache_keys.values()))
+    stats_by_property = {
+        pid: cached[key] for pid, key in cache_keys.items() if key in cached
+    }
+
+    missing_ids = [pid for pid in property_ids if pid not in stats_by_property]
+    if missing_ids:
+        rooms_totals = {
+            prop.id: prop.rooms_total for prop in props if hasattr(prop, "rooms_total")
+        }
+        computed = _calculate_hotel_stats_bulk(
+            missing_ids,
+            year,
+            month,
+            rooms_totals if len(rooms_totals) == len(property_ids) else None,
+        )
+        # Прошедшие месяцы не меняются сами по себе — в общем кэше храним
+        # до смены версии.
+        if get_period_bounds(year, month)[1] < timezone.localdate():
+            timeout = _past_month_stats_timeout()
+        else:
+            timeout = HOTEL_STATS_CACHE_TIMEOUT
+        cache.set_many({cache_keys[pid]: computed[pid] for pid in missing_ids}, timeout)
+        stats_by_property.update(computed)
+
+    return {pid: stats_by_property[pid] for pid in property_ids}
+
+
+def _calculate_hotel_stats_bulk(
+    property_ids: list[int],
+    year: int,
+    month: int,
+    rooms_totals: dict[int, int] | None = None,
+) -> dict[int, dict]:
+    period_start, period_end = get_period_bounds(year, month)
+
+    # Всего активных номеров по отелям.
+    if rooms_totals is None:
+        rooms_totals = dict(
+            Unit.objects.filter(
+                property_id__in=property_ids,
+                status=Unit.Status.ACTIVE,
+                is_active=True,
+            )
+            .values("property_id")
+            .annotate(rooms_total=Count("id"))
+            .order_by()
+            .values_list("property_id", "rooms_total")
+        )
+
+    rows_by_property: dict[int, list] = {property_id: [] for property_id in property_ids}
+    for property_id, day, occupied, revenue_cents in hotel_day_rows(
+        property_ids, period_start, period_end
+    ):
+        rows_by_property[property_id].append((day, occupied, revenue_cents))
+
+    return {
+        property_id: _build_hotel_stats(
+            property_id,
+            year,
+            month,
+            rooms_totals.get(property_id, 0),
+            rows_by_property[property_id],
+        )
+        for property_id in property_ids
+    }
+
+
+def with_rooms_total(properties_qs):
+    """
+    Аннотирует объекты числом активных номеров (rooms_total) для calculate_hotel_stats_bulk.
+    """
+    return properties_qs.annotate(
+        rooms_total=Count(
+            "units",
+            filter=Q(units__status=Unit.Status.ACTIVE, units__is_active=True),
+        )
+    )
+
+
+def calculate_hotel_stats(prop: Property, year: int, month: int) -> dict:
+    """
+    Считает помесячные метрики по отелю:
+    - summary (occupancy_avg, adr_avg, revpar_avg, rooms_revenue_total);
+    - разрез по дням (occupancy, adr, revpar).
+    """
+    return calculate_hotel_stats_bulk([prop], year, month)[prop.id]
+
+
+def period_days_iso(period_start: date, days_in_period: int) -> list[str]:
+    """
+    Даты периода в ISO-формате, по порядку.
+    """
+    start_ord = period_start.toordinal()
+    return [
+        date.fromordinal(day_ord).isoformat()
+        for day_ord in range(start_ord, start_ord + days_in_period)
+    ]
+
+
+def _empty_hotel_stats(property_id: int, year: int, month: int, rooms_total: int) -> dict:
+    """
+    Метрики периода без бронирований: все дни одинаковые, считать нечего.
+    """
+    period_start, period_end = get_period_bounds(year, month)
+    days_in_period = period_end.day
+    zero = 0.0 if rooms_total > 0 else None
+
+    day_template = {
+        "rooms_total": rooms_total,
+        "rooms_occupied": 0,
+        "occupancy": zero,
+        "rooms_revenue": 0.0,
+        "adr": None,
+        "revpar": zero,
+    }
+    days_data = [
+        {"date": day, **day_template}
+        for day in period_days_iso(period_start, days_in_period)
+    ]
+
+    return {
+        "property_id": property_id,
+        "period": {"year": year, "month": month},
+        "summary": {
+            "rooms_total": rooms_total,
+            "rooms_revenue_total": 0.0,
+            "occupancy_avg": zero,
+            "adr_avg": None,
+            "revpar_avg": zero,
+        },
+        "days": days_data,
+    }
+
+
+def _build_hotel_stats(
+    property_id: int,
+    year: int,
+    month: int,
+    rooms_total: int,
+    day_rows: list[tuple[date, int, int]],
+) -> dict:
+    period_start, period_end = get_period_bounds(year, month)
+    days_in_period = period_end.day
+
+    if not day_rows:
+        return _empty_hotel_stats(property_id, year, month, rooms_total)
+
+    # Занятые юниты и выручка (в целых копейках) раскладываем в массивы
+    # по индексу дня; во float переводим один раз, уже после суммирования.
+    occupied_by_day = [0] * days_in_period
+    revenue_cents_by_day = [0] * days_in_period
+    start_ord = period_start.toordinal()
+    for day, occupied, revenue_cents in day_rows:
+        idx = day.toordinal() - start_ord
+        occupied_by_day[idx] = occupied
+        revenue_cents_by_day[idx] = revenue_cents
+    revenue_by_day = [cents / 100.0 for cents in revenue_cents_by_day]
+
+    # Метрики по дням считаем поэлементно над массивами, во float.
+    if rooms_total > 0:
+        occupancy_by_day = [occupied / rooms_total for occupied in occupied_by_day]
+        revpar_by_day = [revenue / rooms_total for revenue in revenue_by_day]
+    else:
+        occupancy_by_day = [None] * days_in_period
+        revpar_by_day = [None] * days_in_period
+    adr_by_day = [
+        revenue / occupied if occupied > 0 else None
+        for occupied, revenue in zip(occupied_by_day, revenue_by_day)
+    ]
+
+    day_dates = period_days_iso(period_start, days_in_period)
+    days_data = [
+        {
+            "date": day_dates[idx],
+            "rooms_total": rooms_total,
+            "rooms_occupied": occupied_by_day[idx],
+            "occupancy": occupancy_by_day[idx],
+            "rooms_revenue": revenue_by_day[idx],
+            "adr": adr_by_day[idx],
+            "revpar": revpar_by_day[idx],
+        }
+        for idx in range(days_in_period)
+    ]
+
+    # Агрегаты по периоду.
+    total_rooms_revenue = sum(revenue_cents_by_day) / 100.0
+    total_rooms_occupied = sum(occupied_by_day)
+
+    if rooms_total > 0:
+        occupancy_avg = sum(occupancy_by_day) / days_in_period
+        revpar_avg = total_rooms_revenue / (rooms_total * days_in_period)
+    else:
+        occupancy_avg = None
+        revpar_avg = None
+
+    if total_rooms_occupied > 0:
+        adr_avg = total_rooms_revenue / total_rooms_occupied
+    else:
+        adr_avg = None
+
+    summary = {
+        "rooms_total": rooms_total,
+        "rooms_revenue_total": total_rooms_revenue,
+        "occupancy_avg": occupancy_avg,
+        "adr_avg": adr_avg,
+        "revpar_avg": revpar_avg,
+    }
+
+    return {
+        "property_id": property_id,
+        "period": {"year": year, "month": month},
+        "summary": summary,
+        "days": days_data,
+    }
@@ -0,0 +1,34 @@
+"""
+Сброс кэша метрик отеля (calculate_hotel_stats) при изменении бронирований и юнитов.
+
+Версия сбрасывается и у прежнего объекта записи: перенос брони или юнита
+на другой объект меняет метрики обоих.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.bookings.models import Booking
+from .services import bump_hotel_stats_version
+from .models import Unit
+
+
+@receiver(pre_save, sender=Booking)
+@receiver(pre_save, sender=Unit)
+def remember_old_property(sender, instance, raw=False, **kwargs):
+    # Прежний объект записи; его же читают сигналы revenue (кэш числа юнитов).
+    instance._old_property_id = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._old_property_id = (
+        sender.objects.filter(pk=instance.pk).values_list("property_id", flat=True).first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Booking)
+@receiver([post_save, post_delete], sender=Unit)
+def stats_source_changed(sender, instance, **kwargs):
+    bump_hotel_stats_version(instance.property_id)
+    old_property_id = getattr(instance, "_old_property_id", None)
+    if old_property_id != instance.property_id:
+        bump_hotel_stats_version(old_property_id)
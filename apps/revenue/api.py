@@ -49,7 +49,7 @@ class PriceRecommendationQuerySerializer(serializers.Serializer):
 
 
 class PriceRecommendationSerializer(serializers.ModelSerializer):
-    unit_id = serializers.IntegerField(source="unit_id", read_only=True)
+    unit_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = PriceRecommendation
@@ -93,7 +93,7 @@ class PriceRecommendationListView(APIView):
         elif date_to:
             qs = qs.filter(date__lte=date_to)
 
-        qs = qs.order_by("date", "created_at")
+        qs = qs.only(*PriceRecommendationSerializer.Meta.fields).order_by("date", "created_at")
 
         out = PriceRecommendationSerializer(qs, many=True)
         return Response(out.data)
@@ -6,3 +6,5 @@ class RevenueConfig(AppConfig):
     name = "apps.revenue"
     verbose_name = "Revenue Management"
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.properties.models import Unit
+from apps.revenue.services import build_price_recommendations, copy_price_recommendations
+
+
+class Command(BaseCommand):
+    help = "Массово пересчитывает рекомендации цен по активным юнитам на горизонт дат"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date-from", help="Первая дата YYYY-MM-DD (по умолчанию — сегодня)")
+        parser.add_argument("--days", type=int, default=60, help="Число дней горизонта (по умолчанию 60)")
+        parser.add_argument("--property", type=int, help="ID объекта (по умолчанию — все)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Сколько пар (юнит, дата) считать и записывать за один проход",
+        )
+
+    def handle(self, *args, **options):
+        if options["date_from"]:
+            try:
+                date_from = date.fromisoformat(options["date_from"])
+            except ValueError:
+                raise CommandError("Дата должна быть в формате YYYY-MM-DD.")
+        else:
+            date_from = timezone.now().date()
+
+        days = options["days"]
+        if days <= 0:
+            raise CommandError("Число дней должно быть положительным.")
+        chunk_size = max(options["chunk_size"], days)
+
+        units = Unit.objects.filter(status=Unit.Status.ACTIVE, is_active=True).only(
+            "id", "property"
+        )
+        if options["property"]:
+            units = units.filter(property_id=options["property"])
+
+        dates = [date_from + timedelta(days=offset) for offset in range(days)]
+
+        count = 0
+        pairs = []
+        for unit in units.order_by("property_id", "id").iterator(chunk_size=2000):
+            pairs.extend((unit, target_date) for target_date in dates)
+            if len(pairs) >= chunk_size:
+                count += copy_price_recommendations(build_price_recommendations(pairs))
+                pairs = []
+        if pairs:
+            count += copy_price_recommendations(build_price_recommendations(pairs))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Рекомендации пересчитаны: {count} с {date_from:%d.%m.%Y} на {days} дн."
+            )
+        )
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-15 23:28
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def drop_duplicate_recommendations(apps, schema_editor):
+    """
+    Перед уникальным ограничением оставляет по (юнит, дата) только последнюю
+    запись (максимальный id).
+
+    ВНИМАНИЕ: более ранние рекомендации на ту же дату удаляются безвозвратно —
+    откат миграции их не восстанавливает. Если история нужна, выгрузите
+    таблицу revenue_pricerecommendation до применения миграции.
+    """
+    PriceRecommendation = apps.get_model('revenue', 'PriceRecommendation')
+    keep_ids = (
+        PriceRecommendation.objects.values('unit_id', 'date')
+        .order_by()
+        .annotate(last_id=Max('id'))
+        .values('last_id')
+    )
+    PriceRecommendation.objects.exclude(id__in=keep_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0003_property_brand_name_property_checkin_time_and_more'),
+        ('revenue', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pricerecommendation',
+            index=models.Index(fields=['unit', '-date'], name='price_rec_unit_date_idx'),
+        ),
+        migrations.RunPython(drop_duplicate_recommendations, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='pricerecommendation',
+            constraint=models.UniqueConstraint(fields=('unit', 'date'), name='uniq_price_rec_unit_date'),
+        ),
+    ]
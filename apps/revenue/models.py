@@ -5,7 +5,7 @@ from django.db import models
 
 class PriceRecommendation(models.Model):
     """
-    Лог рекомендации цены для юнита на конкретную дату.
+    Рекомендация цены для юнита на конкретную дату.
     """
 
     unit = models.ForeignKey(
@@ -42,6 +42,14 @@ class PriceRecommendation(models.Model):
         verbose_name = "Рекомендация цены"
         verbose_name_plural = "Рекомендации цен"
         ordering = ["-date", "-created_at"]
+        indexes = [
+            # История рекомендаций юнита: диапазон дат, от новых к старым.
+            models.Index(fields=["unit", "-date"], name="price_rec_unit_date_idx"),
+        ]
+        constraints = [
+            # Одна актуальная рекомендация на юнит и дату — пересчёт делает upsert.
+            models.UniqueConstraint(fields=["unit", "date"], name="uniq_price_rec_unit_date"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.unit} @ {self.date}: {self.recommended_price}"
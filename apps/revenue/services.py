@@ -1,13 +1,109 @@
+import csv
+import io
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import (
+    DateField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Q,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
 
 from apps.bookings.models import Booking, RatePlan
 from apps.properties.models import Unit
 from .models import PriceRecommendation
 
 
+# Число забронированных ночей по дням горизонта: на каждый (объект, день) —
+# сколько броней покрывают эту ночь. Суммы по окнам дают то же, что
+# пересечения броней с окном в _calc_occupancies.
+_BOOKED_NIGHTS_SQL_POSTGRES = """
+    SELECT b.property_id, days.d, COUNT(*)
+    FROM (
+        SELECT generate_series(%s::timestamp, %s::timestamp, interval '1 day')::date AS d
+    ) AS days
+    JOIN {table} AS b ON b.check_in <= days.d AND b.check_out > days.d
+    WHERE b.property_id IN ({property_ids})
+      AND b.check_in <= %s
+      AND b.check_out > %s
+      AND b.check_out > b.check_in
+    GROUP BY b.property_id, days.d
+"""
+
+_BOOKED_NIGHTS_SQL_SQLITE = """
+    WITH RECURSIVE days(d) AS (
+        SELECT date(%s)
+        UNION ALL
+        SELECT date(d, '+1 day') FROM days WHERE d < date(%s)
+    )
+    SELECT b.property_id, days.d, COUNT(*)
+    FROM days
+    JOIN {table} AS b ON b.check_in <= days.d AND b.check_out > days.d
+    WHERE b.property_id IN ({property_ids})
+      AND b.check_in <= %s
+      AND b.check_out > %s
+      AND b.check_out > b.check_in
+    GROUP BY b.property_id, days.d
+"""
+
+# Массовая запись рекомендаций на PostgreSQL (copy_price_recommendations).
+_COPY_RECOMMENDATION_FIELDS = (
+    "unit",
+    "date",
+    "base_price",
+    "recommended_price",
+    "min_price",
+    "max_price",
+    "occupancy_7d",
+    "occupancy_30d",
+    "season",
+    "notes",
+    "created_at",
+)
+# Поля, которые перезаписывает повторный расчёт на ту же (юнит, дата).
+_UPSERT_RECOMMENDATION_FIELDS = _COPY_RECOMMENDATION_FIELDS[2:]
+_COPY_RECOMMENDATIONS_SQL = "COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+
+# Окна загрузки (в днях), которые учитывает рекомендация цены.
+_OCCUPANCY_PERIODS = (7, 30)
+
+_ZERO_PRICE = Decimal("0.00")
+
+# Коэффициенты и границы цены в процентах от базы. Цена считается в целых
+# копейках; округление до копейки — банковское, как у Decimal.quantize.
+_COEF_HIGH_SEASON = 110
+_MIN_PERCENT = 70
+_MAX_PERCENT = 150
+
+# Корректировка по загрузке за 30 дней: (нижняя граница, процент, пояснение).
+# Загрузка не выше _LOW_OCCUPANCY даёт скидку, между порогами — без изменений.
+_OCCUPANCY_ADJUSTMENTS = (
+    (0.8, 115, "Применена надбавка +15%."),
+    (0.6, 105, "Применена надбавка +5%."),
+)
+_LOW_OCCUPANCY = 0.3
+_LOW_OCCUPANCY_ADJUSTMENT = (90, "Применена скидка -10%.")
+_NO_OCCUPANCY_ADJUSTMENT = (None, "Корректировка не применена.")
+
+_SEASON_NOTES = {
+    "high": "Сезон: высокий.",
+    "low": "Сезон: низкий.",
+    "shoulder": "Сезон: межсезонье.",
+}
+_HIGH_SEASON_NOTE = "Сезон: высокий. Дополнительная надбавка +10%."
+
+
 @dataclass
 class PriceSuggestion:
     base_price: Decimal
@@ -27,7 +123,11 @@ def _detect_season(target_date: date) -> str:
       - low: декабрь, январь, февраль;
       - shoulder: остальные.
     """
-    month = target_date.month
+    return _season_for_month(target_date.month)
+
+
+@lru_cache(maxsize=12)
+def _season_for_month(month: int) -> str:
     if month in (12, 1, 2):
         return "low"
     if month in (6, 7, 8, 9):
@@ -35,87 +135,382 @@ def _detect_season(target_date: date) -> str:
     return "shoulder"
 
 
-def _calc_occupancy_for_period(unit: Unit, end_date: date, days: int) -> Optional[float]:
+# Базовая цена активного тарифа объекта. Сбрасывается сигналами RatePlan
+# (см. signals.py), таймаут — страховка от изменений в обход ORM.
+BASE_PRICE_CACHE_TIMEOUT = 5 * 60
+
+
+def base_price_cache_key(property_id: int) -> str:
+    return f"revenue:base_price:{property_id}"
+
+
+def _get_active_base_price(property_id: int) -> Decimal:
     """
-    Считает загрузку по объекту unit.property за период [end_date - days, end_date):
-      occupied_nights / (units_count * days).
+    Базовая цена первого активного RatePlan объекта; 0.00, если её нет.
     """
-    start_date = end_date - timedelta(days=days)
-    prop = unit.property
 
-    units_qs = prop.units.filter(
-        status=Unit.Status.ACTIVE,
-        is_active=True,
+    def load() -> Decimal:
+        base_price = (
+            RatePlan.objects.filter(property_id=property_id, is_active=True)
+            .order_by("id")
+            .values_list("base_price", flat=True)
+            .first()
+        )
+        return _ZERO_PRICE if base_price is None else base_price
+
+    return cache.get_or_set(base_price_cache_key(property_id), load, BASE_PRICE_CACHE_TIMEOUT)
+
+
+# Число активных юнитов объекта. Сбрасывается сигналами Unit (см. signals.py).
+ACTIVE_UNITS_CACHE_TIMEOUT = 10 * 60
+
+
+def active_units_cache_key(property_id: int) -> str:
+    return f"revenue:active_units:{property_id}"
+
+
+def _active_units_count(property_id: int) -> int:
+    """
+    Количество активных юнитов объекта.
+    """
+
+    def load() -> int:
+        return Unit.objects.filter(
+            property_id=property_id,
+            status=Unit.Status.ACTIVE,
+            is_active=True,
+        ).count()
+
+    return cache.get_or_set(
+        active_units_cache_key(property_id), load, ACTIVE_UNITS_CACHE_TIMEOUT
     )
-    units_count = units_qs.count()
-    if units_count == 0 or days <= 0:
-        return None
-
-    bookings_qs = Booking.objects.filter(
-        property=prop,
-        check_in__lt=end_date,
-        check_out__gt=start_date,
+
+
+def _overlap_nights(start_date: date, end_date: date) -> Sum:
+    """
+    Сумма ночей пересечения брони с периодом [start_date, end_date).
+    """
+    return Sum(
+        ExpressionWrapper(
+            Least("check_out", Value(end_date, output_field=DateField()))
+            - Greatest("check_in", Value(start_date, output_field=DateField())),
+            output_field=DurationField(),
+        ),
+        filter=Q(check_out__gt=start_date),
     )
 
-    occupied_nights = 0
-    for booking in bookings_qs:
-        start = max(booking.check_in, start_date)
-        end = min(booking.check_out, end_date)
-        nights = (end - start).days
-        if nights > 0:
-            occupied_nights += nights
 
-    denominator = units_count * days
-    if denominator <= 0:
-        return None
+def _calc_occupancies(
+    unit: Unit,
+    end_date: date,
+    periods: Tuple[int, ...],
+) -> Dict[int, Optional[float]]:
+    """
+    Считает загрузку по объекту unit.property за периоды [end_date - days, end_date)
+    для каждого days из periods: occupied_nights / (units_count * days).
+
+    Все периоды заканчиваются в end_date, поэтому считаются одним запросом
+    по бронированиям самого длинного из них.
+    """
+    property_id = unit.property_id
 
-    return float(occupied_nights / denominator)
+    units_count = _active_units_count(property_id)
+    valid_periods = [days for days in periods if days > 0]
+    if units_count == 0 or not valid_periods:
+        return {days: None for days in periods}
+
+    longest_start = end_date - timedelta(days=max(valid_periods))
+    booked = (
+        Booking.objects.filter(
+            property_id=property_id,
+            check_in__lt=end_date,
+            check_out__gt=longest_start,
+        )
+        .filter(check_out__gt=F("check_in"))
+        .aggregate(
+            **{
+                f"nights_{days}": _overlap_nights(end_date - timedelta(days=days), end_date)
+                for days in valid_periods
+            }
+        )
+    )
+
+    occupancies: Dict[int, Optional[float]] = {}
+    for days in periods:
+        if days <= 0:
+            occupancies[days] = None
+            continue
+        nights = booked[f"nights_{days}"]
+        occupied_nights = nights.days if nights else 0
+        occupancies[days] = float(occupied_nights / (units_count * days))
+    return occupancies
 
 
 def suggest_price_for_unit_on_date(unit: Unit, target_date: date) -> Dict:
     """
-    Возвращает и логирует рекомендацию цены для юнита на дату.
+    Возвращает и сохраняет рекомендацию цены для юнита на дату
+    (повторный расчёт перезаписывает прежнюю).
     """
-    prop = unit.property
-
     # 1. Базовая цена из RatePlan.
-    rate_plan: Optional[RatePlan] = (
-        RatePlan.objects.filter(property=prop, is_active=True).order_by("id").first()
+    base_price = _get_active_base_price(unit.property_id)
+
+    # 2. Загрузка за 7 и 30 дней — одним запросом. Без базовой цены
+    # рекомендация нулевая при любой загрузке — запросы не нужны.
+    if base_price > 0:
+        occupancies = _calc_occupancies(unit, target_date, _OCCUPANCY_PERIODS)
+    else:
+        occupancies = dict.fromkeys(_OCCUPANCY_PERIODS)
+
+    recommendation = _build_recommendation(
+        unit, target_date, base_price, occupancies[7], occupancies[30]
     )
-    if rate_plan is None or rate_plan.base_price is None:
-        base_price = Decimal("0.00")
+    _upsert_recommendations([recommendation])
+    return _recommendation_payload(recommendation)
+
+
+def _booked_nights_by_day(
+    property_ids: List[int], start_date: date, end_date: date
+) -> Dict[int, Dict[date, int]]:
+    """
+    Забронированные ночи по дням [start_date, end_date] для объектов:
+    property_id -> {день: число броней}. Дни без броней не возвращаются.
+    """
+    if connection.vendor == "postgresql":
+        sql = _BOOKED_NIGHTS_SQL_POSTGRES
     else:
-        base_price = rate_plan.base_price
+        sql = _BOOKED_NIGHTS_SQL_SQLITE
+    sql = sql.format(
+        table=connection.ops.quote_name(Booking._meta.db_table),
+        property_ids=", ".join(["%s"] * len(property_ids)),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [start_date, end_date, *property_ids, end_date, start_date])
+        rows = cursor.fetchall()
 
-    # 2. Загрузка за периоды.
-    occupancy_7d = _calc_occupancy_for_period(unit, target_date, 7)
-    occupancy_30d = _calc_occupancy_for_period(unit, target_date, 30)
+    nights: Dict[int, Dict[date, int]] = {property_id: {} for property_id in property_ids}
+    for property_id, day, count in rows:
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        nights[property_id][day] = count
+    return nights
 
+
+def _upsert_recommendations(recommendations: List[PriceRecommendation]) -> None:
+    """
+    Сохраняет рекомендации: существующая строка на (юнит, дата) перезаписывается.
+    """
+    PriceRecommendation.objects.bulk_create(
+        _unique_recommendations(recommendations),
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["unit", "date"],
+        update_fields=_UPSERT_RECOMMENDATION_FIELDS,
+    )
+
+
+def build_price_recommendations(
+    unit_date_pairs: Iterable[Tuple[Unit, date]],
+) -> List[PriceRecommendation]:
+    """
+    Рассчитывает (не сохраняя) рекомендации для пар (юнит, дата).
+
+    Загрузка по всем объектам берётся одним запросом по дням горизонта,
+    окна 7/30 дней считаются по префиксным суммам; число активных юнитов
+    и базовая цена — один раз на объект. Для объектов без базовой цены
+    загрузка не считается.
+    """
+    pairs = list(unit_date_pairs)
+    if not pairs:
+        return []
+
+    base_prices = {
+        property_id: _get_active_base_price(property_id)
+        for property_id in {unit.property_id for unit, _target_date in pairs}
+    }
+    property_ids = sorted(
+        property_id for property_id, base_price in base_prices.items() if base_price > 0
+    )
+    horizon_start = min(target_date for _unit, target_date in pairs) - timedelta(
+        days=max(_OCCUPANCY_PERIODS)
+    )
+    horizon_end = max(target_date for _unit, target_date in pairs) - timedelta(days=1)
+    horizon_days = (horizon_end - horizon_start).days + 1
+
+    nights_by_day = (
+        _booked_nights_by_day(property_ids, horizon_start, horizon_end) if property_ids else {}
+    )
+
+    # prefix[i] — ночи за дни [horizon_start, horizon_start + i).
+    prefix_by_property: Dict[int, List[int]] = {}
+    for property_id, nights in nights_by_day.items():
+        prefix = [0] * (horizon_days + 1)
+        running = 0
+        for offset in range(horizon_days):
+            running += nights.get(horizon_start + timedelta(days=offset), 0)
+            prefix[offset + 1] = running
+        prefix_by_property[property_id] = prefix
+
+    units_counts: Dict[int, int] = {}
+    recommendations: List[PriceRecommendation] = []
+
+    for unit, target_date in pairs:
+        property_id = unit.property_id
+        base_price = base_prices[property_id]
+        if base_price <= 0:
+            recommendations.append(
+                _build_recommendation(unit, target_date, base_price, None, None)
+            )
+            continue
+
+        if property_id not in units_counts:
+            units_counts[property_id] = _active_units_count(property_id)
+        units_count = units_counts[property_id]
+
+        occupancies: Dict[int, Optional[float]] = {}
+        prefix = prefix_by_property[property_id]
+        end_offset = (target_date - horizon_start).days
+        for days in _OCCUPANCY_PERIODS:
+            if units_count == 0:
+                occupancies[days] = None
+                continue
+            occupied_nights = prefix[end_offset] - prefix[end_offset - days]
+            occupancies[days] = float(occupied_nights / (units_count * days))
+
+        recommendations.append(
+            _build_recommendation(
+                unit,
+                target_date,
+                base_price,
+                occupancies[7],
+                occupancies[30],
+            )
+        )
+
+    return recommendations
+
+
+def _unique_recommendations(
+    recommendations: List[PriceRecommendation],
+) -> List[PriceRecommendation]:
+    # В одной пачке ключ (юнит, дата) не должен повторяться — берём последнюю.
+    return list({(rec.unit_id, rec.date): rec for rec in recommendations}.values())
+
+
+def copy_price_recommendations(recommendations: List[PriceRecommendation]) -> int:
+    """
+    Записывает рекомендации для массового пересчёта (команда recompute_prices).
+
+    На PostgreSQL строки уходят одним COPY ... FROM STDIN в CSV — без
+    разбора многострочных INSERT и без возврата id. На остальных СУБД
+    (и если драйвер не умеет COPY) — bulk_create с upsert по (юнит, дата).
+    Возвращает число записанных строк.
+    """
+    if not recommendations:
+        return 0
+
+    copy_sql = _COPY_RECOMMENDATIONS_SQL.format(
+        table=connection.ops.quote_name(PriceRecommendation._meta.db_table),
+        columns=", ".join(
+            connection.ops.quote_name(PriceRecommendation._meta.get_field(name).column)
+            for name in _COPY_RECOMMENDATION_FIELDS
+        ),
+    )
+
+    recommendations = _unique_recommendations(recommendations)
+    with transaction.atomic(), connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        can_copy = hasattr(raw_cursor, "copy_expert") or hasattr(raw_cursor, "copy")
+        if connection.vendor != "postgresql" or not can_copy:
+            _upsert_recommendations(recommendations)
+            return len(recommendations)
+
+        # COPY не умеет ON CONFLICT: сначала убираем прежние строки этих пар.
+        dates_by_unit: Dict[int, set] = {}
+        for recommendation in recommendations:
+            dates_by_unit.setdefault(recommendation.unit_id, set()).add(recommendation.date)
+        existing = Q()
+        for unit_id, dates in dates_by_unit.items():
+            existing |= Q(unit_id=unit_id, date__in=sorted(dates))
+        PriceRecommendation.objects.filter(existing).delete()
+
+        buffer = _recommendations_csv(recommendations)
+        if hasattr(raw_cursor, "copy_expert"):
+            # psycopg2
+            raw_cursor.copy_expert(copy_sql, buffer)
+        else:
+            # psycopg 3
+            with raw_cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+    return len(recommendations)
+
+
+def _recommendations_csv(recommendations: List[PriceRecommendation]) -> io.StringIO:
+    # None -> пустое поле без кавычек, что COPY в CSV читает как NULL.
+    created_at = timezone.now().isoformat()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for recommendation in recommendations:
+        writer.writerow(
+            (
+                recommendation.unit_id,
+                recommendation.date.isoformat(),
+                recommendation.base_price,
+                recommendation.recommended_price,
+                recommendation.min_price,
+                recommendation.max_price,
+                _csv_float(recommendation.occupancy_7d),
+                _csv_float(recommendation.occupancy_30d),
+                recommendation.season,
+                recommendation.notes,
+                created_at,
+            )
+        )
+    buffer.seek(0)
+    return buffer
+
+
+def _csv_float(value: Optional[float]) -> str:
+    return "" if value is None else repr(value)
+
+
+def _build_recommendation(
+    unit: Unit,
+    target_date: date,
+    base_price: Decimal,
+    occupancy_7d: Optional[float],
+    occupancy_30d: Optional[float],
+) -> PriceRecommendation:
+    """
+    Рассчитывает рекомендацию (ещё не сохранённую) по базовой цене и загрузке.
+    """
     # 3. Сезон.
     season = _detect_season(target_date)
 
-    # 4. Коэффициент на основе загрузки.
-    coeff = Decimal("1.00")
+    # 4. Коэффициент на основе загрузки: произведение процентов.
+    coeff_num, coeff_den = 1, 1
+    occupancy_note = None
 
     if base_price > 0 and occupancy_30d is not None:
-        occ30 = occupancy_30d
-        if occ30 >= 0.8:
-            coeff *= Decimal("1.15")
-        elif occ30 >= 0.6:
-            coeff *= Decimal("1.05")
-        elif occ30 <= 0.3:
-            coeff *= Decimal("0.90")
+        percent, occupancy_note = _occupancy_adjustment(occupancy_30d)
+        if percent is not None:
+            coeff_num, coeff_den = coeff_num * percent, coeff_den * 100
 
     # Дополнительный коэффициент для high‑сезона.
-    if base_price > 0 and season == "high":
-        coeff *= Decimal("1.10")
+    high_season_markup = base_price > 0 and season == "high"
+    if high_season_markup:
+        coeff_num, coeff_den = coeff_num * _COEF_HIGH_SEASON, coeff_den * 100
 
     # 5. Диапазон и обрезка.
     if base_price > 0:
-        min_price = (base_price * Decimal("0.7")).quantize(Decimal("0.01"))
-        max_price = (base_price * Decimal("1.5")).quantize(Decimal("0.01"))
-        raw_recommended = (base_price * coeff).quantize(Decimal("0.01"))
-        recommended_price = max(min_price, min(max_price, raw_recommended))
+        base_cents = int(base_price.scaleb(2))
+        min_cents = _div_round_half_even(base_cents * _MIN_PERCENT, 100)
+        max_cents = _div_round_half_even(base_cents * _MAX_PERCENT, 100)
+        raw_cents = _div_round_half_even(base_cents * coeff_num, coeff_den)
+        min_price = _cents_to_decimal(min_cents)
+        max_price = _cents_to_decimal(max_cents)
+        raw_recommended = _cents_to_decimal(raw_cents)
+        recommended_price = _cents_to_decimal(max(min_cents, min(max_cents, raw_cents)))
     else:
         min_price = base_price
         max_price = base_price
@@ -123,47 +518,22 @@ def suggest_price_for_unit_on_date(unit: Unit, target_date: date) -> Dict:
         recommended_price = base_price
 
     # 6. Формирование человеко-читабельного пояснения.
-    notes_lines = []
-    notes_lines.append(f"Базовая цена: {base_price} ₽.")
-
-    if occupancy_30d is not None and base_price > 0:
-        occ_percent = f"{occupancy_30d * 100:.0f}%"
-        if occupancy_30d >= 0.8:
-            notes_lines.append(
-                f"Загрузка за 30 дней: {occ_percent}. Применена надбавка +15%."
-            )
-        elif occupancy_30d >= 0.6:
-            notes_lines.append(
-                f"Загрузка за 30 дней: {occ_percent}. Применена надбавка +5%."
-            )
-        elif occupancy_30d <= 0.3:
-            notes_lines.append(
-                f"Загрузка за 30 дней: {occ_percent}. Применена скидка -10%."
-            )
-        else:
-            notes_lines.append(f"Загрузка за 30 дней: {occ_percent}. Корректировка не применена.")
-
-    season_ru = {
-        "high": "высокий",
-        "low": "низкий",
-        "shoulder": "межсезонье",
-    }.get(season, season)
-
-    if base_price > 0 and season == "high":
-        notes_lines.append(f"Сезон: {season_ru}. Дополнительная надбавка +10%.")
-    else:
-        notes_lines.append(f"Сезон: {season_ru}.")
-
-    if base_price > 0 and recommended_price != raw_recommended:
+    notes_lines = [f"Базовая цена: {base_price} ₽."]
+    if occupancy_note is not None:
         notes_lines.append(
-            f"Цена ограничена диапазоном {min_price}–{max_price} ₽."
+            "Загрузка за 30 дней: {:.0f}%. {}".format(occupancy_30d * 100, occupancy_note)
         )
-
+    if high_season_markup:
+        notes_lines.append(_HIGH_SEASON_NOTE)
+    else:
+        notes_lines.append(_SEASON_NOTES.get(season) or f"Сезон: {season}.")
+    if base_price > 0 and recommended_price != raw_recommended:
+        notes_lines.append(f"Цена ограничена диапазоном {min_price}–{max_price} ₽.")
     notes_lines.append(f"Итоговая рекомендованная цена: {recommended_price} ₽.")
 
     notes = " ".join(notes_lines)
 
-    recommendation = PriceRecommendation.objects.create(
+    return PriceRecommendation(
         unit=unit,
         date=target_date,
         base_price=base_price,
@@ -176,6 +546,34 @@ def suggest_price_for_unit_on_date(unit: Unit, target_date: date) -> Dict:
         notes=notes,
     )
 
+
+def _occupancy_adjustment(occupancy_30d: float) -> Tuple[Optional[int], str]:
+    """
+    Процент корректировки цены по загрузке за 30 дней и пояснение к нему.
+    """
+    for threshold, percent, note in _OCCUPANCY_ADJUSTMENTS:
+        if occupancy_30d >= threshold:
+            return percent, note
+    if occupancy_30d <= _LOW_OCCUPANCY:
+        return _LOW_OCCUPANCY_ADJUSTMENT
+    return _NO_OCCUPANCY_ADJUSTMENT
+
+
+def _div_round_half_even(numerator: int, denominator: int) -> int:
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def _recommendation_payload(recommendation: PriceRecommendation) -> Dict:
+    # Значения берутся из объекта в памяти — те же, что ушли в INSERT;
+    # перечитывать запись из БД не нужно.
     return {
         "base_price": float(recommendation.base_price),
         "recommended_price": float(recommendation.recommended_price),
@@ -0,0 +1,28 @@
+"""
+Сброс кэшей рекомендаций цен (suggest_price_for_unit_on_date): базовой цены —
+при изменении тарифных планов, числа активных юнитов — при изменении юнитов.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.bookings.models import RatePlan
+from apps.properties.models import Unit
+from .services import active_units_cache_key, base_price_cache_key
+
+
+@receiver([post_save, post_delete], sender=RatePlan)
+def rate_plan_changed(sender, instance: RatePlan, **kwargs):
+    cache.delete(base_price_cache_key(instance.property_id))
+
+
+@receiver([post_save, post_delete], sender=Unit)
+def unit_changed(sender, instance: Unit, **kwargs):
+    property_ids = {instance.property_id}
+    # Юнит перенесён на другой объект — число юнитов меняется у обоих.
+    # Прежний объект запоминает pre_save-сигнал приложения properties.
+    old_property_id = getattr(instance, "_old_property_id", None)
+    if old_property_id:
+        property_ids.add(old_property_id)
+    cache.delete_many([active_units_cache_key(property_id) for property_id in property_ids])
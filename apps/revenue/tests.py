@@ -0,0 +1,100 @@
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from apps.owners.models import Owner
+from apps.properties.models import Property, Unit
+from .services import _active_units_count
+
+
+class DropDuplicateRecommendationsMigrationTests(TransactionTestCase):
+    """
+    Миграция 0002 оставляет по (юнит, дата) только последнюю рекомендацию.
+    """
+
+    migrate_from = [("revenue", "0001_initial")]
+    migrate_to = [("revenue", "0002_price_recommendation_unit_date")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        old_apps = executor.loader.project_state(self.migrate_from).apps
+
+        owner = old_apps.get_model("owners", "Owner").objects.create(name="Owner")
+        prop = old_apps.get_model("properties", "Property").objects.create(
+            owner=owner, type="hotel", name="Hotel", city="Sochi", address="Street 1"
+        )
+        Unit = old_apps.get_model("properties", "Unit")
+        self.unit_id = Unit.objects.create(property=prop, type="room", code="U1").pk
+        self.other_unit_id = Unit.objects.create(property=prop, type="room", code="U2").pk
+
+        PriceRecommendation = old_apps.get_model("revenue", "PriceRecommendation")
+        for unit_id, target_date, price in (
+            (self.unit_id, date(2025, 3, 1), "100.00"),
+            (self.unit_id, date(2025, 3, 1), "110.00"),
+            (self.unit_id, date(2025, 3, 1), "120.00"),
+            (self.unit_id, date(2025, 3, 2), "130.00"),
+            (self.other_unit_id, date(2025, 3, 1), "140.00"),
+        ):
+            PriceRecommendation.objects.create(
+                unit_id=unit_id,
+                date=target_date,
+                base_price=Decimal(price),
+                recommended_price=Decimal(price),
+                min_price=Decimal(price),
+                max_price=Decimal(price),
+            )
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_keeps_latest_recommendation_per_unit_and_date(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+        new_apps = executor.loader.project_state(self.migrate_to).apps
+        PriceRecommendation = new_apps.get_model("revenue", "PriceRecommendation")
+
+        rows = sorted(
+            PriceRecommendation.objects.values_list("unit_id", "date", "recommended_price")
+        )
+        self.assertEqual(
+            rows,
+            [
+                (self.unit_id, date(2025, 3, 1), Decimal("120.00")),
+                (self.unit_id, date(2025, 3, 2), Decimal("130.00")),
+                (self.other_unit_id, date(2025, 3, 1), Decimal("140.00")),
+            ],
+        )
+
+
+class ActiveUnitsCacheTests(TestCase):
+    """
+    Кэш числа активных юнитов сбрасывается у обоих объектов при переносе юнита.
+    """
+
+    def setUp(self):
+        cache.clear()
+        owner = Owner.objects.create(name="Owner")
+        self.source = Property.objects.create(
+            owner=owner, type="hotel", name="Source", city="Sochi", address="Street 1"
+        )
+        self.target = Property.objects.create(
+            owner=owner, type="hotel", name="Target", city="Sochi", address="Street 2"
+        )
+        self.unit = Unit.objects.create(property=self.source, type="room", code="U1")
+        Unit.objects.create(property=self.source, type="room", code="U2")
+
+    def test_moving_unit_updates_both_properties(self):
+        self.assertEqual(_active_units_count(self.source.id), 2)
+        self.assertEqual(_active_units_count(self.target.id), 0)
+
+        self.unit.property = self.target
+        self.unit.save()
+
+        self.assertEqual(_active_units_count(self.source.id), 1)
+        self.assertEqual(_active_units_count(self.target.id), 1)
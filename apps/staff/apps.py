@@ -6,3 +6,5 @@ class StaffConfig(AppConfig):
     name = "apps.staff"
     verbose_name = "Сотрудники"
 
+    def ready(self):
+        from . import signals  # noqa: F401
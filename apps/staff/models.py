@@ -1,10 +1,44 @@
 from django.conf import settings
 from django.contrib.auth.models import Group
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 
 from apps.properties.models import Property
 
 
+# id групп ролей по имени: набор ролей мал и неизменен. Сбрасывается сигналами
+# Group (см. signals.py); без общего кэша (REDIS_URL) удаление группы в другом
+# процессе сюда не доходит — поэтому срок жизни ограничен.
+ROLE_GROUP_CACHE_TIMEOUT = 10 * 60
+
+
+def role_group_cache_key(role: str) -> str:
+    return f"staff:role_group_id:{role}"
+
+
+def _role_group_id(role: str, create: bool = True) -> int | None:
+    """
+    id группы Django для роли; при create=False отсутствующая группа не создаётся.
+    """
+    cache_key = role_group_cache_key(role)
+    group_id = cache.get(cache_key)
+    if group_id is not None:
+        return group_id
+
+    if create:
+        group_id = Group.objects.get_or_create(name=role)[0].pk
+    else:
+        group_id = Group.objects.filter(name=role).values_list("pk", flat=True).first()
+        if group_id is None:
+            return None
+    # Группа могла быть создана в транзакции, которая ещё откатится — кэшируем
+    # id только после фиксации.
+    transaction.on_commit(
+        lambda: cache.set(cache_key, group_id, ROLE_GROUP_CACHE_TIMEOUT)
+    )
+    return group_id
+
+
 class Staff(models.Model):
     """
     Модель сотрудника компании Sochi.Rent.
@@ -100,25 +134,27 @@ class Staff(models.Model):
 
         # Удаляем старую роль-группу, если изменилась.
         if old_role and old_role != self.role:
-            try:
-                old_group = Group.objects.get(name=old_role)
-            except Group.DoesNotExist:
-                old_group = None
-            if old_group is not None:
-                self.user.groups.remove(old_group)
+            old_group_id = _role_group_id(old_role, create=False)
+            if old_group_id is not None:
+                self.user.groups.remove(old_group_id)
 
         # Назначаем новую группу по роли.
-        group, _created = Group.objects.get_or_create(name=self.role)
-        self.user.groups.add(group)
+        self.user.groups.add(_role_group_id(self.role))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Роль на момент загрузки — для синхронизации групп после сохранения
+        # (см. signals.py), без повторного SELECT в save(). Если роль отложена
+        # (.only()/.defer()), прежнюю роль save() прочитает из БД.
+        if "role" in field_names:
+            instance._loaded_role = instance.role
+        return instance
 
     def save(self, *args, **kwargs):
-        old_role = None
-        if self.pk:
-            try:
-                old = Staff.objects.get(pk=self.pk)
-                old_role = old.role
-            except Staff.DoesNotExist:
-                old_role = None
-
+        # Экземпляр с pk, созданный не из БД: прежнюю роль узнаём явно.
+        if self.pk and not hasattr(self, "_loaded_role"):
+            self._loaded_role = (
+                Staff.objects.filter(pk=self.pk).values_list("role", flat=True).first()
+            )
         super().save(*args, **kwargs)
-        self._sync_role_group(old_role)
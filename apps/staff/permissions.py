@@ -1,4 +1,4 @@
-from typing import Iterable, List, Set
+from typing import Dict, FrozenSet, Iterable, Set
 
 from django.contrib.auth.models import Group
 from rest_framework.permissions import BasePermission
@@ -6,47 +6,53 @@ from rest_framework.permissions import BasePermission
 from .models import Staff
 
 
-def get_user_roles(user) -> Set[str]:
+def get_user_roles(user, request=None) -> Set[str]:
     """
     Возвращает множество ролей пользователя:
     - role из Staff, если профиль существует;
     - имена групп (Group.name), к которым принадлежит пользователь.
+
+    Если передан request, результат запоминается на нём: permission-классы
+    одного запроса не повторяют запросы к Staff и Group.
     """
     if not user or not user.is_authenticated:
         return set()
 
-    roles: Set[str] = set()
-
-    # Роль из Staff-профиля.
-    try:
-        staff: Staff = user.staff_profile  # type: ignore[attr-defined]
-    except Staff.DoesNotExist:
-        staff = None  # type: ignore[assignment]
-
-    if staff is not None and staff.role:
-        roles.add(staff.role)
-
-    # Имена групп из Django auth.
-    group_names = Group.objects.filter(user=user).values_list("name", flat=True)
-    roles.update(group_names)
-
-    return roles
+    if request is not None:
+        cached = getattr(request, "_cached_user_roles", None)
+        if cached is not None and cached[0] == user.pk:
+            return cached[1]
+        roles = get_user_roles(user)
+        request._cached_user_roles = (user.pk, roles)
+        return roles
+
+    # Роль из Staff-профиля (если он есть) и имена групп из Django auth —
+    # одним запросом, без обращения к staff_profile и DoesNotExist.
+    staff_role = (
+        Staff.objects.filter(user_id=user.pk)
+        .exclude(role="")
+        .values_list("role", flat=True)
+        .order_by()
+    )
+    group_names = Group.objects.filter(user=user).values_list("name", flat=True).order_by()
+    return set(staff_role.union(group_names, all=True))
 
 
 class BaseRolePermission(BasePermission):
     """
     Базовый permission-класс, проверяющий наличие у пользователя нужной роли.
 
-    Наследники должны определить атрибут allowed_roles: Iterable[str].
+    Наследники должны определить атрибут allowed_roles — frozenset ролей,
+    собранный один раз при объявлении класса.
     """
 
-    allowed_roles: Iterable[str] = ()
+    allowed_roles: Iterable[str] = frozenset()
 
     def has_permission(self, request, view) -> bool:
         if not request.user or not request.user.is_authenticated:
             return False
-        user_roles = get_user_roles(request.user)
-        return bool(set(self.allowed_roles) & user_roles)
+        user_roles = get_user_roles(request.user, request)
+        return not user_roles.isdisjoint(self.allowed_roles)
 
 
 class HasAnyRole(BaseRolePermission):
@@ -57,7 +63,7 @@ class HasAnyRole(BaseRolePermission):
 
     class SomeView(...):
         permission_classes = [HasAnyRole]
-        required_roles = ["CEO", "COO"]
+        required_roles = frozenset({"CEO", "COO"})
     """
 
     def has_permission(self, request, view) -> bool:
@@ -72,7 +78,7 @@ class IsFinanceRole(BaseRolePermission):
     Пример permission-класса для финансовых эндпоинтов.
     """
 
-    allowed_roles: List[str] = ["CEO", "CFO", "Finance"]
+    allowed_roles: FrozenSet[str] = frozenset({"CEO", "CFO", "Finance"})
 
 
 class IsCleaningRole(BaseRolePermission):
@@ -80,7 +86,7 @@ class IsCleaningRole(BaseRolePermission):
     Пример permission-класса для задач клининга.
     """
 
-    allowed_roles: List[str] = ["CEO", "COO", "Cleaning"]
+    allowed_roles: FrozenSet[str] = frozenset({"CEO", "COO", "Cleaning"})
 
 
 class IsMaintenanceRole(BaseRolePermission):
@@ -88,7 +94,7 @@ class IsMaintenanceRole(BaseRolePermission):
     Пример permission-класса для задач эксплуатации.
     """
 
-    allowed_roles: List[str] = ["CEO", "COO", "Maintenance"]
+    allowed_roles: FrozenSet[str] = frozenset({"CEO", "COO", "Maintenance"})
 
 
 class IsFinanceSummaryRole(BaseRolePermission):
@@ -96,15 +102,17 @@ class IsFinanceSummaryRole(BaseRolePermission):
     Доступ к агрегированному финансовому summary.
     """
 
-    allowed_roles: List[str] = [
-        "CEO",
-        "COO",
-        "CFO",
-        "Finance",
-        "GM",
-        "HotelDirector",
-        "Marketing",
-    ]
+    allowed_roles: FrozenSet[str] = frozenset(
+        {
+            "CEO",
+            "COO",
+            "CFO",
+            "Finance",
+            "GM",
+            "HotelDirector",
+            "Marketing",
+        }
+    )
 
 
 class IsPropertyManagerDashboardRole(BaseRolePermission):
@@ -112,7 +120,7 @@ class IsPropertyManagerDashboardRole(BaseRolePermission):
     Доступ к панели Property Manager Dashboard.
     """
 
-    allowed_roles: List[str] = ["CEO", "COO", "PropertyManager"]
+    allowed_roles: FrozenSet[str] = frozenset({"CEO", "COO", "PropertyManager"})
 
 
 class IsAIRole(BaseRolePermission):
@@ -127,14 +135,16 @@ class IsAIRole(BaseRolePermission):
       - Quality.
     """
 
-    allowed_roles: List[str] = [
-        "CEO",
-        "COO",
-        "PropertyManager",
-        "GM",
-        "Maintenance",
-        "Quality",
-    ]
+    allowed_roles: FrozenSet[str] = frozenset(
+        {
+            "CEO",
+            "COO",
+            "PropertyManager",
+            "GM",
+            "Maintenance",
+            "Quality",
+        }
+    )
 
 
 class IsRevenueRole(BaseRolePermission):
@@ -147,26 +157,28 @@ class IsRevenueRole(BaseRolePermission):
       - GM.
     """
 
-    allowed_roles: List[str] = [
-        "CEO",
-        "COO",
-        "PropertyManager",
-        "GM",
-    ]
-
-
-ROLE_ACCESS_MATRIX = {
-    # Зона: список ролей, которым по умолчанию разрешён доступ.
-    "finance": ["CEO", "CFO", "Finance"],
-    "operations_all": ["CEO", "COO"],
-    "owners_and_contracts": ["CEO", "CBDO", "Finance"],
-    "hotel_management": ["CEO", "COO", "HotelDirector", "GM"],
-    "frontdesk": ["CEO", "COO", "HotelDirector", "GM", "FrontDesk"],
-    "cleaning": ["CEO", "COO", "Cleaning"],
-    "maintenance": ["CEO", "COO", "Maintenance"],
-    "quality": ["CEO", "COO", "Quality"],
-    "marketing": ["CEO", "COO", "Marketing"],
-    "it": ["CEO", "IT"],
+    allowed_roles: FrozenSet[str] = frozenset(
+        {
+            "CEO",
+            "COO",
+            "PropertyManager",
+            "GM",
+        }
+    )
+
+
+ROLE_ACCESS_MATRIX: Dict[str, FrozenSet[str]] = {
+    # Зона: набор ролей, которым по умолчанию разрешён доступ.
+    "finance": frozenset({"CEO", "CFO", "Finance"}),
+    "operations_all": frozenset({"CEO", "COO"}),
+    "owners_and_contracts": frozenset({"CEO", "CBDO", "Finance"}),
+    "hotel_management": frozenset({"CEO", "COO", "HotelDirector", "GM"}),
+    "frontdesk": frozenset({"CEO", "COO", "HotelDirector", "GM", "FrontDesk"}),
+    "cleaning": frozenset({"CEO", "COO", "Cleaning"}),
+    "maintenance": frozenset({"CEO", "COO", "Maintenance"}),
+    "quality": frozenset({"CEO", "COO", "Quality"}),
+    "marketing": frozenset({"CEO", "COO", "Marketing"}),
+    "it": frozenset({"CEO", "IT"}),
 }
 
 
@@ -176,7 +188,7 @@ def user_has_zone_access(user, zone: str) -> bool:
     """
     if not user or not user.is_authenticated:
         return False
-    allowed_roles = set(ROLE_ACCESS_MATRIX.get(zone, []))
+    allowed_roles = ROLE_ACCESS_MATRIX.get(zone)
     if not allowed_roles:
         return False
-    return bool(allowed_roles & get_user_roles(user))
+    return not allowed_roles.isdisjoint(get_user_roles(user))
@@ -0,0 +1,30 @@
+"""
+Синхронизация группы пользователя с ролью сотрудника после сохранения Staff.
+"""
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Staff, role_group_cache_key
+
+
+@receiver(post_save, sender=Staff)
+def staff_saved(sender, instance: Staff, update_fields=None, raw=False, **kwargs):
+    # loaddata (raw) группы не трогает; сохранение без роли в update_fields тоже.
+    if raw:
+        return
+    if update_fields is not None and "role" not in update_fields:
+        return
+
+    instance._sync_role_group(getattr(instance, "_loaded_role", None))
+    instance._loaded_role = instance.role
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def role_group_changed(sender, created=False, **kwargs):
+    # Группу переименовали или удалили — кэш id групп ролей больше не верен.
+    if not created:
+        cache.delete_many([role_group_cache_key(role) for role in Staff.Role.values])
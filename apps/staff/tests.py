@@ -0,0 +1,74 @@
+import json
+
+from django.contrib.auth.models import Group, User
+from django.core import serializers
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from .models import Staff, role_group_cache_key
+
+
+class RoleGroupSyncTests(TestCase):
+    """
+    Синхронизация групп пользователя с ролью сотрудника.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rolled_back_group_is_not_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Staff.objects.create(
+                        user=User.objects.create_user("rolled_back"), role=Staff.Role.GM
+                    )
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(Group.objects.filter(name=Staff.Role.GM).exists())
+        self.assertIsNone(cache.get(role_group_cache_key(Staff.Role.GM)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            staff = Staff.objects.create(user=User.objects.create_user("gm"), role=Staff.Role.GM)
+
+        group = Group.objects.get(name=Staff.Role.GM)
+        self.assertEqual(list(staff.user.groups.all()), [group])
+        self.assertEqual(cache.get(role_group_cache_key(Staff.Role.GM)), group.pk)
+
+    def test_role_change_on_deferred_instance_removes_old_group(self):
+        user = User.objects.create_user("deferred")
+        staff = Staff.objects.create(user=user, role=Staff.Role.CFO)
+
+        staff = Staff.objects.only("id", "user").get(pk=staff.pk)
+        staff.role = Staff.Role.COO
+        staff.save()
+
+        self.assertEqual(
+            list(user.groups.values_list("name", flat=True)), [Staff.Role.COO]
+        )
+
+    def test_raw_save_does_not_touch_groups(self):
+        user = User.objects.create_user("fixture")
+        fixture = json.dumps(
+            [
+                {
+                    "model": "staff.staff",
+                    "pk": 1,
+                    "fields": {
+                        "user": user.pk,
+                        "role": Staff.Role.CFO,
+                        "full_name": "Fixture",
+                        "created_at": "2025-01-01T00:00:00Z",
+                        "updated_at": "2025-01-01T00:00:00Z",
+                    },
+                }
+            ]
+        )
+        for obj in serializers.deserialize("json", fixture):
+            obj.save()
+
+        self.assertFalse(user.groups.exists())
+        self.assertFalse(Group.objects.exists())
@@ -113,6 +113,17 @@ if db_name:
             "PASSWORD": env("DB_PASSWORD"),
             "HOST": env("DB_HOST", default="127.0.0.1"),
             "PORT": env("DB_PORT", default="5432"),
+            # Постоянные соединения: без TCP/auth-рукопожатия на каждый запрос.
+            "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # Ограничение на время запроса, мс; по умолчанию выключено (0).
+                # Действует на все соединения, включая migrate и management-команды,
+                # поэтому задаётся только в окружении веб-процессов.
+                "options": "-c statement_timeout={}".format(
+                    env.int("DB_STATEMENT_TIMEOUT", default=0)
+                ),
+            },
         }
     }
 else:
@@ -123,6 +134,27 @@ else:
         }
     }
 
+# ────────────────────────────────────────────
+# КЭШ
+# ────────────────────────────────────────────
+# По умолчанию: локальный кэш процесса.
+# Если в .env задан REDIS_URL — общий кэш в Redis (нужен пакет redis).
+redis_url = env("REDIS_URL", default=None)
+
+if redis_url:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": redis_url,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # ────────────────────────────────────────────
 # ЛОКАЛИЗАЦИЯ
 # ────────────────────────────────────────────
@@ -150,10 +182,12 @@ CORS_ALLOW_ALL_ORIGINS = env.bool("CORS_ALLOW_ALL_ORIGINS", default=True)
 # ────────────────────────────────────────────
 # DRF / AUTH
 # ────────────────────────────────────────────
+# BasicAuthentication проверяет пароль (медленный хэш) на каждом запросе —
+# оставляем её только для локальной отладки API.
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.BasicAuthentication",
+        ("rest_framework.authentication.SessionAuthentication",)
+        + (("rest_framework.authentication.BasicAuthentication",) if DEBUG else ())
     ),
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",